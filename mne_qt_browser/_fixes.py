@@ -20,3 +20,16 @@ except ImportError:
     @contextmanager
     def capture_exceptions():
         yield []
+
+
+# numba
+try:
+    from numba import jit, prange
+
+    has_numba = True
+except ImportError:
+    has_numba = False
+    prange = range
+
+    def jit(**kwargs):  # noqa: D103
+        return lambda func: func
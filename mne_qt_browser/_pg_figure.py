@@ -4,20 +4,22 @@
 #
 # License: BSD-3-Clause
 
-import datetime
 import functools
 import gc
 import inspect
-import math
 import os
 import platform
 import sys
+import time
 import warnings
 import weakref
 from ast import literal_eval
+from bisect import bisect_left, bisect_right
 from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
 from copy import copy
 from functools import partial
+from itertools import chain
 from os.path import getsize
 from pathlib import Path
 
@@ -40,7 +42,6 @@ from mne import channel_indices_by_type
 from mne.annotations import _sync_onset
 from mne.io.pick import _DATA_CH_TYPES_ORDER_DEFAULT, _DATA_CH_TYPES_SPLIT
 from mne.utils import _check_option, _to_rgb, get_config, logger, sizeof_fmt, warn
-from mne.viz import plot_sensors
 from mne.viz._figure import BrowserBase
 from mne.viz.backends._utils import _init_mne_qtapp, _qt_raise_window
 from mne.viz.utils import _figure_agg, _merge_annotations, _simplify_float
@@ -50,6 +51,7 @@ from pyqtgraph import (
     GraphicsView,
     InfiniteLine,
     InfLineLabel,
+    ItemGroup,
     LinearRegionItem,
     PlotCurveItem,
     PlotDataItem,
@@ -57,12 +59,14 @@ from pyqtgraph import (
     Point,
     TextItem,
     ViewBox,
+    getConfigOption,
     mkBrush,
     mkColor,
     mkPen,
     setConfigOption,
 )
 from qtpy.QtCore import (
+    QCoreApplication,
     QEvent,
     QLineF,
     QPoint,
@@ -71,9 +75,11 @@ from qtpy.QtCore import (
     QSettings,
     QSignalBlocker,
     QThread,
+    QTimer,
     Signal,
 )
 from qtpy.QtGui import (
+    QCloseEvent,
     QColor,
     QFont,
     QGuiApplication,
@@ -83,6 +89,8 @@ from qtpy.QtGui import (
     QPainter,
     QPainterPath,
     QPixmap,
+    QStandardItem,
+    QStandardItemModel,
     QTransform,
 )
 from qtpy.QtTest import QTest
@@ -98,6 +106,7 @@ from qtpy.QtWidgets import (
     QDockWidget,
     QDoubleSpinBox,
     QFormLayout,
+    QGraphicsItem,
     QGraphicsLineItem,
     QGraphicsScene,
     QGraphicsView,
@@ -107,6 +116,7 @@ from qtpy.QtWidgets import (
     QInputDialog,
     QLabel,
     QLineEdit,
+    QListView,
     QMainWindow,
     QMenu,
     QMessageBox,
@@ -131,7 +141,7 @@ from scipy.stats import zscore
 
 from . import _browser_instances
 from ._colors import _lab_to_rgb, _rgb_to_lab
-from ._fixes import capture_exceptions
+from ._fixes import capture_exceptions, has_numba, jit, prange
 
 name = "pyqtgraph"
 
@@ -232,6 +242,218 @@ def _get_channel_scaling(widget, ch_type):
     return inv_norm
 
 
+def _get_inverse_idx(mne, key):
+    """Get a mapping from channel index to position in getattr(mne, key).
+
+    The mapping is rebuilt only when the attribute was reassigned, so repeated
+    lookups (e.g. one per trace) are O(1) instead of searching the array.
+    Channels which appear more than once (e.g. in selection mode) map to their
+    first position.
+    """
+    arr = getattr(mne, key)
+    cache = vars(mne).setdefault("_inverse_idxs", dict())
+    if key not in cache or cache[key][0] is not arr:
+        inverse_idx = dict()
+        for pos, ch_idx in enumerate(arr.tolist()):
+            inverse_idx.setdefault(ch_idx, pos)
+        cache[key] = (arr, inverse_idx)
+    return cache[key][1]
+
+
+def _get_picked_ch_types(mne):
+    """Get the channel types of mne.picks as an array and as a set.
+
+    Both are rebuilt only when mne.picks or mne.ch_types was reassigned, so
+    all scalebars share one fancy-indexing per pick change.
+    """
+    cache = vars(mne).setdefault("_picked_ch_types", dict())
+    picks, ch_types = mne.picks, mne.ch_types
+    if cache.get("picks") is not picks or cache.get("ch_types") is not ch_types:
+        picked = ch_types[picks]
+        cache.update(
+            picks=picks, ch_types=ch_types, array=picked, set=set(picked.tolist())
+        )
+    return cache["array"], cache["set"]
+
+
+def _get_cache_mode(mne):
+    """Get the cache mode for items whose pixels rarely change."""
+    if mne.graphics_cache:
+        return QGraphicsItem.CacheMode.DeviceCoordinateCache
+    return QGraphicsItem.CacheMode.NoCache
+
+
+def _rgba_to_premul_argb32(rgba):
+    """Pack an RGBA uint8 image as premultiplied 0xAARRGGBB uint32 values."""
+    rgba = rgba.astype(np.uint32)
+    alpha = rgba[..., 3]
+    argb = alpha << 24
+    for shift, channel in ((16, 0), (8, 1), (0, 2)):
+        argb |= (rgba[..., channel] * alpha // 255) << shift
+    return argb
+
+
+def _get_scale_transform(mne):
+    """Get the transform scaling traces by mne.scale_factor, shared by all."""
+    factor, transform = vars(mne).get("_scale_transform", (None, None))
+    if factor != mne.scale_factor:
+        factor, transform = mne.scale_factor, QTransform()
+        transform.scale(1.0, factor)
+        mne._scale_transform = (factor, transform)
+    return transform
+
+
+def _get_trace_at(mne, y):
+    """Get the only trace whose row contains y, or None.
+
+    The traces are indexed by their y-position until traces are added,
+    removed or moved.
+    """
+    index = getattr(mne, "trace_ypos_index", None)
+    if index is None:
+        index = dict()
+        for trace in mne.traces:
+            index.setdefault(trace.ypos, []).append(trace)
+        mne.trace_ypos_index = index
+    # The y-positions of traces are integers
+    traces = [tr for tr in index.get(round(y), ()) if tr.ypos - 0.5 < y < tr.ypos + 0.5]
+    return traces[0] if len(traces) == 1 else None
+
+
+def _same_range(old, new):
+    """Check if a view range would not change, ignoring floating point noise."""
+    tol = (old[1] - old[0]) * 1e-9
+    return abs(new[0] - old[0]) <= tol and abs(new[1] - old[1]) <= tol
+
+
+def _get_decim_times(mne, decim):
+    """Get mne.times decimated by decim, shared by all traces with that factor."""
+    cache = vars(mne).setdefault("_decim_times", dict())
+    if cache.get("times") is not mne.times:
+        cache.clear()
+        cache["times"] = mne.times
+    if decim not in cache:
+        cache[decim] = mne.times[::decim]
+    return cache[decim]
+
+
+@jit(nopython=True, nogil=True, cache=True, error_model="numpy", parallel=True)
+def _zscore_rows(data, out):  # pragma: no cover
+    n_rows, n_cols = data.shape
+    # Rows are independent, so they are spread over threads
+    for ri in prange(n_rows):
+        mean = 0.0
+        for ci in range(n_cols):
+            mean += data[ri, ci]
+        mean /= n_cols
+        var = 0.0
+        for ci in range(n_cols):
+            var += (data[ri, ci] - mean) ** 2
+        std = np.sqrt(var / n_cols)
+        for ci in range(n_cols):
+            out[ri, ci] = (data[ri, ci] - mean) / std
+
+
+def _zscore(data):
+    """Compute the zscore of each row (like scipy.stats.zscore(data, axis=1))."""
+    if not has_numba or data.size == 0:
+        return zscore(data, axis=1)
+    # The result is only used to pick colors, so single precision is enough.
+    out = np.empty(data.shape, np.float32)
+    _zscore_rows(np.ascontiguousarray(data, dtype=np.float64), out)
+    return out
+
+
+@jit(nopython=True, nogil=True, cache=True, error_model="numpy", parallel=True)
+def _peak_rows(data, ds, out):  # pragma: no cover
+    n_rows = data.shape[0]
+    n = out.shape[1] // 2
+    for ri in prange(n_rows):
+        for bi in range(n):
+            start = bi * ds
+            vmax = vmin = data[ri, start]
+            for ci in range(start + 1, start + ds):
+                value = data[ri, ci]
+                # Propagate NaN like np.max and np.min
+                if value > vmax or np.isnan(value):
+                    vmax = value
+                if value < vmin or np.isnan(value):
+                    vmin = value
+            out[ri, 2 * bi] = vmax
+            out[ri, 2 * bi + 1] = vmin
+
+
+# Roughly the L2 cache of one core
+_PEAK_BLOCK_BYTES = 256 * 1024
+
+
+def _peak_downsample(data, ds, n):
+    """Get maximum and minimum of each bin of ds samples, interleaved."""
+    n_ch = data.shape[0]
+    out = np.empty((n_ch, n * 2), data.dtype)
+    if has_numba and out.size > 0:
+        # Finds both in one pass over the data
+        _peak_rows(data, ds, out)
+    else:
+        # Reduce blocks of channels which fit into the cache, so that the
+        # minimum reads what the maximum has just loaded
+        block = max(1, _PEAK_BLOCK_BYTES // max(1, n * ds * data.itemsize))
+        for start in range(0, n_ch, block):
+            stop = min(start + block, n_ch)
+            y2 = data[start:stop, : n * ds].reshape((stop - start, n, ds))
+            np.max(y2, axis=2, out=out[start:stop, 0::2])
+            np.min(y2, axis=2, out=out[start:stop, 1::2])
+    return out
+
+
+@jit(nopython=True, nogil=True, cache=True, error_model="numpy")
+def _zscore_to_rgba_rows(z, out):  # pragma: no cover
+    n_rows, n_cols = z.shape
+    for ri in range(n_rows):
+        zmin = 0.0
+        zmax = 0.0
+        for ci in range(n_cols):
+            value = z[ri, ci]
+            if value < zmin:
+                zmin = value
+            elif value > zmax:
+                zmax = value
+        for ci in range(n_cols):
+            value = z[ri, ci]
+            if value < 0:
+                out[ri, ci, 0] = 0
+                out[ri, ci, 2] = 255
+                out[ri, ci, 3] = int(255 * value / zmin)
+            elif value > 0:
+                out[ri, ci, 0] = 255
+                out[ri, ci, 2] = 0
+                out[ri, ci, 3] = int(255 * value / zmax)
+            else:  # zero or NaN
+                out[ri, ci, 0] = 0
+                out[ri, ci, 2] = 0
+                out[ri, ci, 3] = 0
+            out[ri, ci, 1] = 0
+
+
+def _zscore_to_rgba(z):
+    """Color zscores red (positive) or blue (negative), scaled per row."""
+    rgba = np.zeros((*z.shape, 4), np.uint8)
+    if has_numba:
+        _zscore_to_rgba_rows(z, rgba)
+        return rgba
+    pos = z > 0  # NaN is neither positive nor negative
+    neg = z < 0
+    zmin = np.min(z, axis=1, initial=0, where=neg, keepdims=True)
+    zmax = np.max(z, axis=1, initial=0, where=pos, keepdims=True)
+    rgba[..., 0][pos] = 255
+    rgba[..., 2][neg] = 255
+    alpha = rgba[..., 3]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        alpha[pos] = 255 * (z / zmax)[pos]
+        alpha[neg] = 255 * (z / zmin)[neg]
+    return rgba
+
+
 def _calc_data_unit_to_physical(widget, units="mm"):
     """Calculate the physical size of a data unit."""
     # Get the ViewBox and its height in pixels
@@ -353,6 +575,10 @@ class DataTrace(PlotCurveItem):
         self.ch_type = None
         # Color-specifier (all possible matplotlib color formats)
         self.color = None
+        # Arguments of the last setData call, to skip redundant redraws.
+        self._set_data_args = None
+        # Reused for data which has to be copied before being plotted.
+        self._data_buf = None
 
         # Attributes for epochs-mode
         # Index of child if child.
@@ -364,6 +590,7 @@ class DataTrace(PlotCurveItem):
         if self.parent_trace is None:
             # Add to main trace list
             self.mne.traces.append(self)
+            self.mne.trace_ypos_index = None
             # References to children
             self.child_traces = list()
             # Colors of trace in viewrange
@@ -373,10 +600,7 @@ class DataTrace(PlotCurveItem):
         self.set_ch_idx(ch_idx)
         self.update_color()
         self.update_scale()
-        # Avoid calling self.update_data() twice on initialization
-        # (because of update_scale()).
-        if self.mne.clipping is None:
-            self.update_data()
+        self.update_data()
 
         # Add to main plot
         self.mne.plt.addItem(self)
@@ -387,6 +611,7 @@ class DataTrace(PlotCurveItem):
         # Only for parent trace
         if self.parent_trace is None:
             self.mne.traces.remove(self)
+            self.mne.trace_ypos_index = None
         self.deleteLater()
 
     @propagate_to_children
@@ -444,11 +669,12 @@ class DataTrace(PlotCurveItem):
     @propagate_to_children
     def update_range_idx(self):  # noqa: D401
         """Update when view-range or ch_idx changes."""
-        self.range_idx = np.argwhere(self.mne.picks == self.ch_idx)[0][0]
+        self.range_idx = _get_inverse_idx(self.mne, "picks")[self.ch_idx]
 
     @propagate_to_children
     def update_ypos(self):  # noqa: D401
         """Update when butterfly is toggled or ch_idx changes."""
+        self.mne.trace_ypos_index = None
         if self.mne.butterfly and self.mne.fig_selection is not None:
             self.ypos = self.mne.selection_ypos_dict[self.ch_idx]
         elif self.mne.fig_selection is not None and self.mne.old_selection == "Custom":
@@ -460,12 +686,10 @@ class DataTrace(PlotCurveItem):
 
     @propagate_to_children
     def update_scale(self):  # noqa: D102
-        transform = QTransform()
-        transform.scale(1.0, self.mne.scale_factor)
-        self.setTransform(transform)
-
-        if self.mne.clipping is not None:
-            self.update_data(propagate=False)
+        transform = _get_scale_transform(self.mne)
+        # Setting the transform invalidates the item even if it is the same
+        if self.transform() != transform:
+            self.setTransform(transform)
 
     @propagate_to_children
     def set_ch_idx(self, ch_idx):
@@ -479,15 +703,22 @@ class DataTrace(PlotCurveItem):
         self.update_range_idx(propagate=False)
         # The order_idx is the index of the channel represented by this trace
         # in the channel-order (defined e.g. by group_by).
-        self.order_idx = np.argwhere(self.mne.ch_order == self.ch_idx)[0][0]
+        self.order_idx = _get_inverse_idx(self.mne, "ch_order")[self.ch_idx]
         self.ch_name = self.mne.inst.ch_names[ch_idx]
         self.isbad = self.ch_name in self.mne.info["bads"]
         self.ch_type = self.mne.ch_types[ch_idx]
         self.update_ypos(propagate=False)
 
     @propagate_to_children
-    def update_data(self):
-        """Update data (fetch data from self.mne according to self.ch_idx)."""
+    def update_data(self, data_changed=True):
+        """Update data (fetch data from self.mne according to self.ch_idx).
+
+        Parameters
+        ----------
+        data_changed : bool
+            Whether the data of the trace might have changed since the last
+            update. Pass False if the trace only moved, to keep its path.
+        """
         if self.mne.is_epochs or (
             self.mne.clipping is not None and self.mne.clipping != "clamp"
         ):
@@ -497,6 +728,13 @@ class DataTrace(PlotCurveItem):
             connect = "all"
             skip = True
 
+        # Traces which only move keep their path, unless it has to be drawn
+        # with other options.
+        set_data_args = (connect, skip, self.mne.antialiasing)
+        if not data_changed and set_data_args == self._set_data_args:
+            self.setPos(0, self.ypos)
+            return
+
         if self.mne.data_precomputed:
             data = self.mne.data[self.order_idx]
             data /= self.mne.scalings[self.ch_type]
@@ -506,13 +744,15 @@ class DataTrace(PlotCurveItem):
 
         # Get decim-specific time if enabled
         if self.mne.decim != 1:
-            times = times[:: self.mne.decim_data[self.range_idx]]
-            data = data[..., :: self.mne.decim_data[self.range_idx]]
+            decim = self.mne.decim_data[self.range_idx]
+            times = _get_decim_times(self.mne, decim)
+            # A contiguous copy lets pyqtgraph convert the data without striding
+            data = self._copy_to_buf(data[..., ::decim])
 
         # For multiple color traces with epochs
         # replace values from other colors with NaN.
         if self.mne.is_epochs:
-            data = np.copy(data)
+            data = self._copy_to_buf(data)
             check_color = self.mne.epoch_color_ref[self.ch_idx, self.mne.epoch_idx]
             bool_ixs = np.invert(np.equal(self.color, check_color).all(axis=1))
             starts = self.mne.boundary_times[self.mne.epoch_idx][bool_ixs]
@@ -530,9 +770,23 @@ class DataTrace(PlotCurveItem):
             skipFiniteCheck=skip,
             antialias=self.mne.antialiasing,
         )
-
+        self._set_data_args = set_data_args
         self.setPos(0, self.ypos)
 
+    def _copy_to_buf(self, data):
+        # Grow the buffer with some headroom, so that scrolling and zooming
+        # don't need a new allocation for each update.
+        n_times = data.shape[-1]
+        if (
+            self._data_buf is None
+            or self._data_buf.shape[-1] < n_times
+            or self._data_buf.dtype != data.dtype
+        ):
+            self._data_buf = np.empty(2 * n_times, dtype=data.dtype)
+        out = self._data_buf[:n_times]
+        np.copyto(out, data)
+        return out
+
     def toggle_bad(self, x=None):
         """Toggle bad status."""
         # Toggle bad epoch
@@ -545,9 +799,7 @@ class DataTrace(PlotCurveItem):
                     to_rgba_array(color), len(self.mne.inst.ch_names), axis=0
                 )
             elif self.mne.epoch_colors is None:
-                new_epo_color = np.concatenate(
-                    [to_rgba_array(c) for c in self.mne.ch_color_ref.values()]
-                )
+                new_epo_color = self.mne.ch_color_array.copy()
             else:
                 new_epo_color = np.concatenate(
                     [to_rgba_array(c) for c in self.mne.epoch_colors[epoch_idx]]
@@ -585,9 +837,8 @@ class DataTrace(PlotCurveItem):
                         to_rgba_array(bad_color), len(self.mne.inst), axis=0
                     )
                 elif self.mne.epoch_colors is None:
-                    ch_color = self.mne.ch_color_ref[self.ch_name]
                     new_ch_color = np.repeat(
-                        to_rgba_array(ch_color), len(self.mne.inst), axis=0
+                        self.mne.ch_color_array[[pick]], len(self.mne.inst), axis=0
                     )
                 else:
                     new_ch_color = np.concatenate(
@@ -660,21 +911,28 @@ class TimeAxis(AxisItem):
         if self.mne.is_epochs:
             epoch_nums = self.mne.inst.selection
             ts = epoch_nums[np.searchsorted(self.mne.midpoints, values)]
-            tick_strings = [str(v) for v in ts]
+            tick_strings = ts.astype(str).tolist()
 
         elif self.mne.time_format == "clock":
-            meas_date = self.mne.info["meas_date"]
-            first_time = datetime.timedelta(seconds=self.mne.inst.first_time)
+            # Do the time arithmetic on all ticks at once in microseconds
+            # (the resolution of datetime) and only format the fractions
+            # per tick.
+            meas_date = self.mne.info["meas_date"].replace(tzinfo=None)
+            first_time = round(self.mne.inst.first_time * 1e6)
+            start = np.datetime64(meas_date, "us") + np.timedelta64(first_time, "us")
+            offsets = np.round(np.asarray(values, dtype=float) * 1e6)
+            val_times = start + offsets.astype(np.int64).astype("timedelta64[us]")
+            val_secs = val_times.astype("datetime64[s]")
+            microseconds = (val_times - val_secs).astype(np.int64).tolist()
 
             digits = np.ceil(-np.log10(min(v[0] for v in self._spacing)) + 1).astype(
                 int
             )
             tick_strings = list()
-            for val in values:
-                val_time = datetime.timedelta(seconds=val) + first_time + meas_date
-                val_str = val_time.strftime("%H:%M:%S")
-                if int(val_time.microsecond):
-                    val_str += f"{round(val_time.microsecond * 1e-6, digits)}"[1:]
+            for val_str, us in zip(np.datetime_as_string(val_secs), microseconds):
+                val_str = val_str[-8:]
+                if us:
+                    val_str += f"{round(us * 1e-6, digits)}"[1:]
                 tick_strings.append(val_str)
         else:
             tick_strings = super().tickStrings(values, scale, spacing)
@@ -720,27 +978,25 @@ class ChannelAxis(AxisItem):
         if self.mne.butterfly and self.mne.fig_selection is not None:
             tick_strings = list(self.weakmain()._make_butterfly_selections_dict())
         elif self.mne.butterfly:
-            _, ixs, _ = np.intersect1d(
-                DATA_CH_TYPES_ORDER, self.mne.ch_types, return_indices=True
-            )
-            ixs.sort()
-            tick_strings = np.array(DATA_CH_TYPES_ORDER)[ixs]
+            tick_strings = self.mne.butterfly_type_order
         else:
             # Get channel-names and by substracting 1 from tick-values
             # since the first channel starts at y=1.
-            tick_strings = self.mne.ch_names[self.mne.ch_order[[v - 1 for v in values]]]
+            ixs = np.asarray(values, dtype=np.intp) - 1
+            tick_strings = self.mne.ch_names[self.mne.ch_order[ixs]]
 
         return tick_strings
 
     def drawPicture(self, p, axisSpec, tickSpecs, textSpecs):
         """Customize drawing of axis items."""
         super().drawPicture(p, axisSpec, tickSpecs, textSpecs)
+        bads = set(self.mne.info["bads"])
         for rect, flags, text in textSpecs:
             if self.mne.butterfly and self.mne.fig_selection is not None:
                 p.setPen(_get_color("black", self.mne.dark))
             elif self.mne.butterfly:
                 p.setPen(_get_color(self.mne.ch_color_dict[text], self.mne.dark))
-            elif text in self.mne.info["bads"]:
+            elif text in bads:
                 p.setPen(_get_color(self.mne.ch_color_bad, self.mne.dark))
             else:
                 p.setPen(_get_color(self.mne.ch_color_ref[text], self.mne.dark))
@@ -759,11 +1015,8 @@ class ChannelAxis(AxisItem):
         """Customize mouse click events."""
         # Clean up channel-texts
         if not self.mne.butterfly:
-            self.ch_texts = {
-                k: v
-                for k, v in self.ch_texts.items()
-                if k in [tr.ch_name for tr in self.mne.traces]
-            }
+            traces = {tr.ch_name: tr for tr in self.mne.traces}
+            self.ch_texts = {k: v for k, v in self.ch_texts.items() if k in traces}
             # Get channel-name from position of channel-description
             ypos = event.scenePos().y()
             y_values = list(self.ch_texts.values())
@@ -773,7 +1026,7 @@ class ChannelAxis(AxisItem):
             y_diff = np.abs(y_values - ypos)
             ch_idx = int(np.argmin(y_diff, axis=0)[0])
             ch_name = list(self.ch_texts)[ch_idx]
-            trace = [tr for tr in self.mne.traces if tr.ch_name == ch_name][0]
+            trace = traces[ch_name]
             if event.button() == Qt.LeftButton:
                 trace.toggle_bad()
             elif event.button() == Qt.RightButton:
@@ -792,6 +1045,19 @@ class BaseScrollBar(QScrollBar):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # The groove only depends on geometry and style, not on the value
+        self._groove_rect = None
+
+    def resizeEvent(self, event):
+        """Customize resize event."""
+        self._groove_rect = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event):
+        """Customize change event."""
+        if event.type() in (QEvent.Type.StyleChange, QEvent.Type.LayoutDirectionChange):
+            self._groove_rect = None
+        super().changeEvent(event)
 
     def mousePressEvent(self, event):
         """Customize mouse click events.
@@ -805,18 +1071,19 @@ class BaseScrollBar(QScrollBar):
             # QPointF->QPoint for hitTestComplexControl
             pos = QPoint(int(round(pos.x())), int(round(pos.y())))
             self.initStyleOption(opt)
-            control = self.style().hitTestComplexControl(
-                QStyle.CC_ScrollBar, opt, pos, self
-            )
+            style = self.style()
+            control = style.hitTestComplexControl(QStyle.CC_ScrollBar, opt, pos, self)
             if (
                 control == QStyle.SC_ScrollBarAddPage
                 or control == QStyle.SC_ScrollBarSubPage
             ):
                 # scroll here
-                gr = self.style().subControlRect(
-                    QStyle.CC_ScrollBar, opt, QStyle.SC_ScrollBarGroove, self
-                )
-                sr = self.style().subControlRect(
+                if self._groove_rect is None:
+                    self._groove_rect = style.subControlRect(
+                        QStyle.CC_ScrollBar, opt, QStyle.SC_ScrollBarGroove, self
+                    )
+                gr = self._groove_rect
+                sr = style.subControlRect(
                     QStyle.CC_ScrollBar, opt, QStyle.SC_ScrollBarSlider, self
                 )
                 if self.orientation() == Qt.Horizontal:
@@ -861,6 +1128,14 @@ class TimeScrollBar(BaseScrollBar):
         # between internal and external changes.
         self.external_change = False
         self.valueChanged.connect(self._time_changed)
+        # While the slider is dragged, apply only the latest position once
+        # per frame (~60 Hz) instead of redrawing for every step.
+        self._pending_time = None
+        self._drag_timer = QTimer(self)
+        self._drag_timer.setSingleShot(True)
+        self._drag_timer.setInterval(16)
+        self._drag_timer.timeout.connect(self._apply_pending_time)
+        self.sliderReleased.connect(self._apply_pending_time)
 
     def _time_changed(self, value):
         if not self.external_change:
@@ -869,6 +1144,17 @@ class TimeScrollBar(BaseScrollBar):
                 value = self.mne.boundary_times[int(value)]
             else:
                 value /= self.step_factor
+            if self.isSliderDown():
+                self._pending_time = value
+                if not self._drag_timer.isActive():
+                    self._drag_timer.start()
+            else:
+                self.mne.plt.setXRange(value, value + self.mne.duration, padding=0)
+
+    def _apply_pending_time(self):
+        self._drag_timer.stop()
+        if self._pending_time is not None:
+            value, self._pending_time = self._pending_time, None
             self.mne.plt.setXRange(value, value + self.mne.duration, padding=0)
 
     def update_value(self, value):
@@ -974,6 +1260,14 @@ class OverviewBar(QGraphicsView):
         self.bg_img = None
         self.bg_pxmp = None
         self.bg_pxmp_item = None
+        # Unscaled background and what it was built from
+        self._bg_src_pxmp = None
+        self._bg_key = None
+        # Looked up for every mouse position in _mapToData
+        self._n_epochs = len(self.mne.inst) if self.mne.is_epochs else None
+        self._times = None if self.mne.is_epochs else self.mne.inst.times
+        # Pens and brushes are shared between items with the same color
+        self._pen_brush_cache = dict()
         # Set minimum Size to 1/10 of display size
         min_h = int(_screen_geometry(self).height() / 10)
         self.setMinimumSize(1, 1)
@@ -988,8 +1282,8 @@ class OverviewBar(QGraphicsView):
         self.bad_line_dict = dict()
         self.update_bad_channels()
 
-        # Events
-        self.event_line_dict = dict()
+        # Events (one path per event id)
+        self.event_path_dict = dict()
         self.update_events()
 
         if self.mne.is_epochs:
@@ -1010,6 +1304,11 @@ class OverviewBar(QGraphicsView):
         # View Range
         self.viewrange_rect = None
         self.update_viewrange()
+        # Coalesces view range updates to at most one per frame (~60 Hz)
+        self._viewrange_timer = QTimer(self)
+        self._viewrange_timer.setSingleShot(True)
+        self._viewrange_timer.setInterval(16)
+        self._viewrange_timer.timeout.connect(self.update_viewrange)
 
     def update_epoch_lines(self):
         """Update representation of epoch lines."""
@@ -1019,6 +1318,7 @@ class OverviewBar(QGraphicsView):
             bottom_right = self._mapFromData(t, len(self.mne.ch_order))
             line = self.scene().addLine(QLineF(top_left, bottom_right), epoch_line_pen)
             line.setZValue(1)
+            line.setCacheMode(_get_cache_mode(self.mne))
             self.epoch_line_dict[t] = line
 
     def update_bad_channels(self):
@@ -1029,14 +1329,15 @@ class OverviewBar(QGraphicsView):
         add_chs = bad_set.difference(line_set)
         rm_chs = line_set.difference(bad_set)
 
+        pen = _get_color(self.mne.ch_color_bad, self.mne.dark)
         for line_idx, ch_idx in enumerate(self.mne.ch_order):
             ch_name = self.mne.ch_names[ch_idx]
             if ch_name in add_chs:
                 start = self._mapFromData(0, line_idx)
                 stop = self._mapFromData(self.mne.inst.times[-1], line_idx)
-                pen = _get_color(self.mne.ch_color_bad, self.mne.dark)
                 line = self.scene().addLine(QLineF(start, stop), pen)
                 line.setZValue(2)
+                line.setCacheMode(_get_cache_mode(self.mne))
                 self.bad_line_dict[ch_name] = line
             elif ch_name in rm_chs:
                 self.scene().removeItem(self.bad_line_dict[ch_name])
@@ -1049,17 +1350,18 @@ class OverviewBar(QGraphicsView):
         add_epos = bad_set.difference(rect_set)
         rm_epos = rect_set.difference(bad_set)
 
+        pen = _get_color(self.mne.epoch_color_bad, self.mne.dark)
         for epo_num in self.mne.inst.selection:
             if epo_num in add_epos:
                 epo_idx = self.mne.inst.selection.tolist().index(epo_num)
                 start, stop = self.mne.boundary_times[epo_idx : epo_idx + 2]
                 top_left = self._mapFromData(start, 0)
                 bottom_right = self._mapFromData(stop, len(self.mne.ch_order))
-                pen = _get_color(self.mne.epoch_color_bad, self.mne.dark)
                 rect = self.scene().addRect(
                     QRectF(top_left, bottom_right), pen=pen, brush=pen
                 )
                 rect.setZValue(3)
+                rect.setCacheMode(_get_cache_mode(self.mne))
                 self.bad_epoch_rect_dict[epo_num] = rect
             elif epo_num in rm_epos:
                 self.scene().removeItem(self.bad_epoch_rect_dict[epo_num])
@@ -1067,58 +1369,84 @@ class OverviewBar(QGraphicsView):
 
     def update_events(self):
         """Update representation of events."""
+        for event_path in self.event_path_dict.values():
+            self.scene().removeItem(event_path)
+        self.event_path_dict.clear()
         if (
             getattr(self.mne, "event_nums", None) is not None
             and self.mne.events_visible
         ):
+            # Draw all lines of an event id as one path in data coordinates,
+            # which is mapped to the scene by _fit_event_paths.
+            n_ch = len(self.mne.ch_order)
+            paths = dict()
             for ev_t, ev_id in zip(self.mne.event_times, self.mne.event_nums):
-                color_name = self.mne.event_color_dict[ev_id]
-                color = _get_color(color_name, self.mne.dark)
-                color.setAlpha(100)
-                pen = self.mne.mkPen(color)
-                top_left = self._mapFromData(ev_t, 0)
-                bottom_right = self._mapFromData(ev_t, len(self.mne.ch_order))
-                line = self.scene().addLine(QLineF(top_left, bottom_right), pen)
-                line.setZValue(1)
-                self.event_line_dict[ev_t] = line
-        else:
-            for event_line in self.event_line_dict.values():
-                self.scene().removeItem(event_line)
-            self.event_line_dict.clear()
+                path = paths.setdefault(ev_id, QPainterPath())
+                path.moveTo(ev_t, 0)
+                path.lineTo(ev_t, n_ch)
+            for ev_id, path in paths.items():
+                pen, _ = self._get_pen_brush(self.mne.event_color_dict[ev_id], 100)
+                event_path = self.scene().addPath(path, pen)
+                event_path.setZValue(1)
+                event_path.setCacheMode(_get_cache_mode(self.mne))
+                self.event_path_dict[ev_id] = event_path
+            self._fit_event_paths()
+
+    def _fit_event_paths(self):
+        # The pens are cosmetic, so scaling does not change the line width
+        transform = QTransform.fromScale(
+            self.width() / self.mne.xmax, self.height() / len(self.mne.ch_order)
+        )
+        for event_path in self.event_path_dict.values():
+            event_path.setTransform(transform)
 
     def update_annotations(self):
         """Update representation of annotations."""
         annotations = self.mne.inst.annotations
         # Exclude non-visible annotations
-        annot_set = set(
-            [
-                annot["onset"]
-                for annot in annotations
-                if self.mne.visible_annotations[annot["description"]]
-            ]
+        visible = np.fromiter(
+            (self.mne.visible_annotations[d] for d in annotations.description),
+            bool,
+            count=len(annotations),
         )
+        annot_set = set(annotations.onset[visible].tolist())
+        # Map each onset to its first index instead of searching for every rect
+        onset_idxs = dict()
+        for annot_idx, onset in enumerate(annotations.onset.tolist()):
+            onset_idxs.setdefault(onset, annot_idx)
         rect_set = set(self.annotations_rect_dict)
 
         add_onsets = annot_set.difference(rect_set)
         rm_onsets = rect_set.difference(annot_set)
 
-        # Add missing onsets
-        for add_onset in add_onsets:
-            plot_onset = _sync_onset(self.mne.inst, add_onset)
-            annot_idx = np.argwhere(self.mne.inst.annotations.onset == add_onset)[0][0]
-            duration = annotations.duration[annot_idx]
+        # Add missing onsets (syncing all onsets at once)
+        add_onsets = list(add_onsets)
+        add_idxs = [onset_idxs[onset] for onset in add_onsets]
+        plot_onsets = durations = np.empty(0)
+        if add_onsets:
+            plot_onsets = _sync_onset(self.mne.inst, np.array(add_onsets))
+            durations = annotations.duration[add_idxs]
+        # Map all new rects at once
+        lefts, top = self._mapFromDataArray(plot_onsets, 0)
+        rights, bottom = self._mapFromDataArray(
+            plot_onsets + durations, len(self.mne.ch_order)
+        )
+        for add_onset, annot_idx, plot_onset, duration, left, right in zip(
+            add_onsets,
+            add_idxs,
+            plot_onsets.tolist(),
+            durations.tolist(),
+            lefts.tolist(),
+            rights.tolist(),
+        ):
             description = annotations.description[annot_idx]
             color_name = self.mne.annotation_segment_colors[description]
-            color = _get_color(color_name, self.mne.dark)
-            color.setAlpha(150)
-            pen = self.mne.mkPen(color)
-            brush = mkBrush(color)
-            top_left = self._mapFromData(plot_onset, 0)
-            bottom_right = self._mapFromData(
-                plot_onset + duration, len(self.mne.ch_order)
+            pen, brush = self._get_pen_brush(color_name, 150)
+            rect = self.scene().addRect(
+                QRectF(left, top, right - left, bottom - top), pen, brush
             )
-            rect = self.scene().addRect(QRectF(top_left, bottom_right), pen, brush)
             rect.setZValue(3)
+            rect.setCacheMode(_get_cache_mode(self.mne))
             self.annotations_rect_dict[add_onset] = {
                 "rect": rect,
                 "plot_onset": plot_onset,
@@ -1131,16 +1459,17 @@ class OverviewBar(QGraphicsView):
             self.scene().removeItem(self.annotations_rect_dict[rm_onset]["rect"])
             self.annotations_rect_dict.pop(rm_onset)
 
-        # Changes
-        for edit_onset in self.annotations_rect_dict:
-            plot_onset = _sync_onset(self.mne.inst, edit_onset)
-            annot_idx = np.where(annotations.onset == edit_onset)[0][0]
+        # Changes (rects which were just added are up to date)
+        for edit_onset in rect_set.intersection(annot_set):
+            annot_dict = self.annotations_rect_dict[edit_onset]
+            annot_idx = onset_idxs[edit_onset]
             duration = annotations.duration[annot_idx]
-            rect_duration = self.annotations_rect_dict[edit_onset]["duration"]
-            rect = self.annotations_rect_dict[edit_onset]["rect"]
+            rect = annot_dict["rect"]
             # Update changed duration
-            if duration != rect_duration:
-                self.annotations_rect_dict[edit_onset]["duration"] = duration
+            if duration != annot_dict["duration"]:
+                # The plot onset only depends on the onset, which is the key
+                plot_onset = annot_dict["plot_onset"]
+                annot_dict["duration"] = duration
                 top_left = self._mapFromData(plot_onset, 0)
                 bottom_right = self._mapFromData(
                     plot_onset + duration, len(self.mne.ch_order)
@@ -1149,15 +1478,22 @@ class OverviewBar(QGraphicsView):
             # Update changed color
             description = annotations.description[annot_idx]
             color_name = self.mne.annotation_segment_colors[description]
-            rect_color = self.annotations_rect_dict[edit_onset]["color"]
-            if color_name != rect_color:
-                color = _get_color(color_name, self.mne.dark)
-                color.setAlpha(150)
-                pen = self.mne.mkPen(color)
-                brush = mkBrush(color)
+            if color_name != annot_dict["color"]:
+                annot_dict["color"] = color_name
+                pen, brush = self._get_pen_brush(color_name, 150)
                 rect.setPen(pen)
                 rect.setBrush(brush)
 
+    def _get_pen_brush(self, color_name, alpha):
+        if isinstance(color_name, np.ndarray):
+            color_name = tuple(color_name)
+        key = (color_name, alpha, self.mne.dark)
+        if key not in self._pen_brush_cache:
+            color = _get_color(color_name, self.mne.dark)
+            color.setAlpha(alpha)
+            self._pen_brush_cache[key] = (self.mne.mkPen(color), mkBrush(color))
+        return self._pen_brush_cache[key]
+
     def update_vline(self):
         """Update representation of vline."""
         if self.mne.is_epochs:
@@ -1202,23 +1538,19 @@ class OverviewBar(QGraphicsView):
         else:
             self.viewrange_rect.setRect(rect)
 
+    def schedule_viewrange_update(self):
+        """Update representation of viewrange with the next frame."""
+        if not self._viewrange_timer.isActive():
+            self._viewrange_timer.start()
+
     def _set_range_from_pos(self, pos):
         x, y = self._mapToData(pos)
 
-        # Set X
-        # Check boundaries
+        # Set X (positions outside of the bar are at its edges and the
+        # clipping below aligns the view range with the boundaries)
         if self.mne.is_epochs:
-            if x == "-offbounds":
-                epo_idx = 0
-            elif x == "+offbounds":
-                epo_idx = len(self.mne.inst) - self.mne.n_epochs
-            else:
-                epo_idx = max(x - self.mne.n_epochs // 2, 0)
+            epo_idx = max(x - self.mne.n_epochs // 2, 0)
             x = self.mne.boundary_times[epo_idx]
-        elif x == "-offbounds":
-            x = 0
-        elif x == "+offbounds":
-            x = self.mne.xmax - self.mne.duration
         else:
             # Move click position to middle of view range
             x -= self.mne.duration / 2
@@ -1228,13 +1560,8 @@ class OverviewBar(QGraphicsView):
         self.mne.plt.setXRange(xmin, xmax, padding=0)
 
         # Set Y
-        if y == "-offbounds":
-            y = 0
-        elif y == "+offbounds":
-            y = self.mne.ymax - (self.mne.n_channels + 1)
-        else:
-            # Move click position to middle of view range
-            y -= self.mne.n_channels / 2
+        # Move click position to middle of view range
+        y -= self.mne.n_channels / 2
         ymin = np.clip(y, 0, self.mne.ymax - (self.mne.n_channels + 1))
         ymax = np.clip(
             ymin + self.mne.n_channels + 1, self.mne.n_channels, self.mne.ymax
@@ -1264,10 +1591,10 @@ class OverviewBar(QGraphicsView):
         # Remove previous item from scene
         if self.bg_pxmp_item is not None and self.bg_pxmp_item in self.scene().items():
             self.scene().removeItem(self.bg_pxmp_item)
-        # Resize Pixmap
-        if self.bg_pxmp is not None:
+        # Resize Pixmap (always from the unscaled one to keep its quality)
+        if self._bg_src_pxmp is not None:
             cnt_rect = self.contentsRect()
-            self.bg_pxmp = self.bg_pxmp.scaled(
+            self.bg_pxmp = self._bg_src_pxmp.scaled(
                 cnt_rect.width(), cnt_rect.height(), Qt.IgnoreAspectRatio
             )
             self.bg_pxmp_item = self.scene().addPixmap(self.bg_pxmp)
@@ -1283,90 +1610,118 @@ class OverviewBar(QGraphicsView):
         self._fit_bg_img()
 
         # Resize Graphics Items (assuming height never changes)
+        # Map from data like _mapFromData, but with the factors computed once
+        # and the scalar setLine/setRect overloads.
+        width, height = cnt_rect.width(), self.height()
+        x_scale = self.width() / self.mne.xmax
+        y_scale = height / len(self.mne.ch_order)
         # Resize bad_channels
         for bad_ch_line in self.bad_line_dict.values():
             current_line = bad_ch_line.line()
             bad_ch_line.setLine(
-                QLineF(current_line.p1(), Point(cnt_rect.width(), current_line.y2()))
+                current_line.x1(), current_line.y1(), width, current_line.y2()
             )
 
         # Resize event-lines
-        for ev_t, event_line in self.event_line_dict.items():
-            top_left = self._mapFromData(ev_t, 0)
-            bottom_right = self._mapFromData(ev_t, len(self.mne.ch_order))
-            event_line.setLine(QLineF(top_left, bottom_right))
+        self._fit_event_paths()
 
         if self.mne.is_epochs:
             # Resize epoch lines
             for epo_t, epoch_line in self.epoch_line_dict.items():
-                top_left = self._mapFromData(epo_t, 0)
-                bottom_right = self._mapFromData(epo_t, len(self.mne.ch_order))
-                epoch_line.setLine(QLineF(top_left, bottom_right))
+                x = epo_t * x_scale
+                epoch_line.setLine(x, 0, x, height)
             # Resize bad rects
             for epo_idx, epoch_rect in self.bad_epoch_rect_dict.items():
                 start, stop = self.mne.boundary_times[epo_idx : epo_idx + 2]
-                top_left = self._mapFromData(start, 0)
-                bottom_right = self._mapFromData(stop, len(self.mne.ch_order))
-                epoch_rect.setRect(QRectF(top_left, bottom_right))
+                epoch_rect.setRect(start * x_scale, 0, (stop - start) * x_scale, height)
         else:
             # Resize annotation-rects
             for annot_dict in self.annotations_rect_dict.values():
-                annot_rect = annot_dict["rect"]
-                plot_onset = annot_dict["plot_onset"]
-                duration = annot_dict["duration"]
-
-                top_left = self._mapFromData(plot_onset, 0)
-                bottom_right = self._mapFromData(
-                    plot_onset + duration, len(self.mne.ch_order)
+                annot_dict["rect"].setRect(
+                    annot_dict["plot_onset"] * x_scale,
+                    0,
+                    annot_dict["duration"] * x_scale,
+                    height,
                 )
-                annot_rect.setRect(QRectF(top_left, bottom_right))
 
         # Update vline
         if all([i is not None for i in [self.v_line, self.mne.vline]]):
-            value = self.mne.vline.value()
-            top_left = self._mapFromData(value, 0)
-            bottom_right = self._mapFromData(value, len(self.mne.ch_order))
-            self.v_line.setLine(QLineF(top_left, bottom_right))
+            x = self.mne.vline.value() * x_scale
+            self.v_line.setLine(x, 0, x, height)
 
         # Update viewrange-rect
-        top_left = self._mapFromData(self.mne.t_start, self.mne.ch_start)
-        bottom_right = self._mapFromData(
-            self.mne.t_start + self.mne.duration,
-            self.mne.ch_start + self.mne.n_channels,
+        self.viewrange_rect.setRect(
+            self.mne.t_start * x_scale,
+            self.mne.ch_start * y_scale,
+            self.mne.duration * x_scale,
+            self.mne.n_channels * y_scale,
         )
-        self.viewrange_rect.setRect(QRectF(top_left, bottom_right))
 
     def set_background(self):
         """Set the background-image for the selected overview-mode."""
+        # Only rebuild the image if its inputs changed (the arrays are
+        # compared by identity since they are replaced and not modified)
+        key = (
+            self.mne.overview_mode,
+            self.mne.dark,
+            self.mne.ch_order,
+            self.mne.zscore_rgba,
+        )
+        if (
+            self._bg_key is not None
+            and key[:2] == self._bg_key[:2]
+            and all(a is b for a, b in zip(key[2:], self._bg_key[2:]))
+        ):
+            return
+        self._bg_key = key
         # Add Overview-Pixmap
         self.bg_pxmp = None
         if self.mne.overview_mode == "empty":
             pass
         elif self.mne.overview_mode == "channels":
-            channel_rgba = np.empty((len(self.mne.ch_order), 2, 4))
-            for line_idx, ch_idx in enumerate(self.mne.ch_order):
-                ch_type = self.mne.ch_types[ch_idx]
-                color = _get_color(self.mne.ch_color_dict[ch_type], self.mne.dark)
-                channel_rgba[line_idx, :] = color.getRgb()
-
-            channel_rgba = np.require(channel_rgba, np.uint8, "C")
+            # Look up the color once per channel type and broadcast it to the
+            # channels, one pixel per row (the pixmap is stretched anyway).
+            ch_types = np.asarray(self.mne.ch_types)[self.mne.ch_order]
+            types, type_idx = np.unique(ch_types, return_inverse=True)
+            # Pack as 0xAARRGGBB, which Qt can use without swizzling bytes
+            type_argb = np.array(
+                [
+                    _get_color(self.mne.ch_color_dict[ch_type], self.mne.dark).rgba()
+                    for ch_type in types
+                ],
+                dtype=np.uint32,
+            )
+            channel_argb = type_argb[type_idx.ravel()][:, np.newaxis]
+            if np.all(channel_argb >> 24 == 0xFF):
+                img_format = QImage.Format_RGB32
+            else:
+                img_format = QImage.Format_ARGB32
             self.bg_img = QImage(
-                channel_rgba,
-                channel_rgba.shape[1],
-                channel_rgba.shape[0],
-                QImage.Format_RGBA8888,
+                channel_argb,
+                channel_argb.shape[1],
+                channel_argb.shape[0],
+                img_format,
             )
             self.bg_pxmp = QPixmap.fromImage(self.bg_img)
 
         elif self.mne.overview_mode == "zscore" and self.mne.zscore_rgba is not None:
+            # Keep a reference, QImage does not copy the buffer
+            self._bg_buf = _rgba_to_premul_argb32(self.mne.zscore_rgba)
+            # Fully opaque images (the same bits premultiplied or not) don't
+            # need alpha blending when drawn
+            if np.all(self._bg_buf >> 24 == 0xFF):
+                img_format = QImage.Format_RGB32
+            else:
+                img_format = QImage.Format_ARGB32_Premultiplied
             self.bg_img = QImage(
-                self.mne.zscore_rgba,
-                self.mne.zscore_rgba.shape[1],
-                self.mne.zscore_rgba.shape[0],
-                QImage.Format_RGBA8888,
+                self._bg_buf,
+                self._bg_buf.shape[1],
+                self._bg_buf.shape[0],
+                img_format,
             )
             self.bg_pxmp = QPixmap.fromImage(self.bg_img)
 
+        self._bg_src_pxmp = self.bg_pxmp
         self._fit_bg_img()
 
     def _mapFromData(self, x, y):
@@ -1376,28 +1731,25 @@ class OverviewBar(QGraphicsView):
 
         return Point(point_x, point_y)
 
+    def _mapFromDataArray(self, xs, ys):
+        # Like _mapFromData, but for arrays of coordinates
+        point_xs = np.multiply(xs, self.width() / self.mne.xmax)
+        point_ys = np.multiply(ys, self.height() / len(self.mne.ch_order))
+
+        return point_xs, point_ys
+
     def _mapToData(self, point):
-        # Include padding from black frame
-        xnorm = point.x() / self.width()
-        if xnorm < 0:
-            x = "-offbounds"
-        elif xnorm > 1:
-            x = "+offbounds"
-        else:
-            if self.mne.is_epochs:
-                # Return epoch index for epochs
-                x = int(len(self.mne.inst) * xnorm)
-            else:
-                time_idx = int((len(self.mne.inst.times) - 1) * xnorm)
-                x = self.mne.inst.times[time_idx]
-
-        ynorm = point.y() / self.height()
-        if ynorm < 0:
-            y = "-offbounds"
-        elif ynorm > 1:
-            y = "+offbounds"
+        # Include padding from black frame and map positions outside of the
+        # bar to its edges
+        xnorm = min(max(point.x() / self.width(), 0.0), 1.0)
+        if self.mne.is_epochs:
+            # Return epoch index for epochs
+            x = int(self._n_epochs * xnorm)
         else:
-            y = len(self.mne.ch_order) * ynorm
+            x = self._times[int((len(self._times) - 1) * xnorm)]
+
+        ynorm = min(max(point.y() / self.height(), 0.0), 1.0)
+        y = len(self.mne.ch_order) * ynorm
 
         return x, y
 
@@ -1416,6 +1768,14 @@ class RawViewBox(ViewBox):
         del main
         self._drag_start = None
         self._drag_region = None
+        # Wheel/trackpad deltas arriving within one event-loop iteration are
+        # summed up and applied with a single scroll.
+        self._pending_hscroll = 0.0
+        self._pending_vscroll = 0.0
+        self._wheel_timer = QTimer(self)
+        self._wheel_timer.setSingleShot(True)
+        self._wheel_timer.setInterval(0)
+        self._wheel_timer.timeout.connect(self._apply_pending_scroll)
 
     def mouseDragEvent(self, event, axis=None):
         """Customize mouse drag events."""
@@ -1452,23 +1812,23 @@ class RawViewBox(ViewBox):
                         self.mne.current_description,
                         self.mne.inst.annotations,
                     )
+                    self.weakmain()._annotations_changed()
 
                     # Add to regions/merge regions
-                    merge_values = [plot_onset, plot_offset]
-                    rm_regions = list()
-                    for region in self.mne.regions:
-                        if region.description != self.mne.current_description:
-                            continue
-                        values = region.getRegion()
-                        if any(plot_onset <= val <= plot_offset for val in values):
-                            merge_values += values
-                            rm_regions.append(region)
-                    if len(merge_values) > 2:
-                        self._drag_region.setRegion(
-                            (min(merge_values), max(merge_values))
-                        )
+                    rm_regions = self.weakmain()._get_regions_to_merge(
+                        description, plot_onset, plot_offset
+                    )
+                    merge_onset, merge_offset = plot_onset, plot_offset
                     for rm_region in rm_regions:
-                        self.weakmain()._remove_region(rm_region, from_annot=False)
+                        start, stop = rm_region.getRegion()
+                        merge_onset = min(merge_onset, start)
+                        merge_offset = max(merge_offset, stop)
+                    if rm_regions:
+                        self._drag_region.setRegion((merge_onset, merge_offset))
+                    main = self.weakmain()
+                    with main._batch_annot_updates():
+                        for rm_region in rm_regions:
+                            main._remove_region(rm_region, from_annot=False)
                     self.weakmain()._add_region(
                         plot_onset,
                         duration,
@@ -1508,9 +1868,24 @@ class RawViewBox(ViewBox):
         ev.accept()
         scroll = -1 * ev.delta() / 120
         if ev.orientation() == Qt.Horizontal:
-            self.weakmain().hscroll(scroll * 10)
+            self._pending_hscroll += scroll * 10
         elif ev.orientation() == Qt.Vertical:
-            self.weakmain().vscroll(scroll)
+            self._pending_vscroll += scroll
+        else:
+            return
+        if not self._wheel_timer.isActive():
+            self._wheel_timer.start()
+
+    def _apply_pending_scroll(self):
+        hscroll, self._pending_hscroll = self._pending_hscroll, 0.0
+        vscroll, self._pending_vscroll = self._pending_vscroll, 0.0
+        main = self.weakmain()
+        if main is None:
+            return
+        if hscroll:
+            main.hscroll(hscroll)
+        if vscroll:
+            main.vscroll(vscroll)
 
     def keyPressEvent(self, event):  # noqa: D102
         self.weakmain().keyPressEvent(event)
@@ -1581,6 +1956,11 @@ class VLine(InfiniteLine):
         self.mne = mne
         self.label = VLineLabel(self)
 
+    def paint(self, p, *args):  # noqa: D102
+        # Vertical lines look the same without antialiasing
+        p.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        super().paint(p, *args)
+
     def setMouseHover(self, hover):
         """Customize the mouse hovering event."""
         super().setMouseHover(hover)
@@ -1616,7 +1996,9 @@ class EventLine(InfiniteLine):
         self.label.setFont(_q_font(10, bold=True))
         self.setZValue(0)
 
-        self.mne.plt.addItem(self)
+    def paint(self, p, *args):  # noqa: D102
+        p.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        super().paint(p, *args)
 
 
 class Crosshair(InfiniteLine):
@@ -1626,16 +2008,20 @@ class Crosshair(InfiniteLine):
         super().__init__(angle=90, movable=False, pen="g")
         self.mne = mne
         self.y = 1
+        self._point_pen = self.mne.mkPen("r", width=4)
 
     def set_data(self, x, y):
         """Set x and y data for crosshair point."""
+        if x == self.value() and y == self.y:
+            return
         self.setPos(x)
         self.y = y
 
     def paint(self, p, *args):  # noqa: D102
+        p.setRenderHint(QPainter.RenderHint.Antialiasing, False)
         super().paint(p, *args)
 
-        p.setPen(self.mne.mkPen("r", width=4))
+        p.setPen(self._point_pen)
         p.drawPoint(Point(self.y, 0))
 
 
@@ -1649,15 +2035,14 @@ class BaseScaleBar:  # noqa: D101
         pass
 
     def _is_visible(self):
-        return self.ch_type in self.mne.ch_types[self.mne.picks]
+        return self.ch_type in _get_picked_ch_types(self.mne)[1]
 
     def _get_ypos(self):
         if self.mne.butterfly:
             self.ypos = self.mne.butterfly_type_order.index(self.ch_type) + 1
         else:
-            ch_type_idxs = np.where(self.mne.ch_types[self.mne.picks] == self.ch_type)[
-                0
-            ]
+            picked_ch_types = _get_picked_ch_types(self.mne)[0]
+            ch_type_idxs = np.where(picked_ch_types == self.ch_type)[0]
 
             for idx in ch_type_idxs:
                 ch_name = self.mne.ch_names[self.mne.picks[idx]]
@@ -1702,7 +2087,9 @@ class ScaleBarText(BaseScaleBar, TextItem):  # noqa: D101
     def update_value(self):
         """Update value of ScaleBarText."""
         inv_norm = _get_channel_scaling(self, self.ch_type)
-        self.setText(f"{_simplify_float(inv_norm)} {self.mne.units[self.ch_type]}")
+        # Mirror the text on the Python side to avoid querying Qt for it
+        self.value_text = f"{_simplify_float(inv_norm)} {self.mne.units[self.ch_type]}"
+        self.setText(self.value_text)
 
     def _set_position(self, x, y):
         self.setPos(x, y)
@@ -1807,6 +2194,18 @@ class SettingsDialog(_BaseDialog):
         )
         layout.addRow("antialiasing", self.antialiasing_box)
 
+        # Graphics cache
+        self.graphics_cache_box = QCheckBox()
+        self.graphics_cache_box.setToolTip(
+            "Enable/Disable caching the rendering of the overview bar.\n"
+            "Disable if the overview bar is not updated correctly."
+        )
+        self.graphics_cache_box.setChecked(self.mne.graphics_cache)
+        self.graphics_cache_box.stateChanged.connect(
+            _methpartial(self._toggle_graphics_cache)
+        )
+        layout.addRow("graphics cache", self.graphics_cache_box)
+
         # Downsampling
         self.downsampling_box = QSpinBox()
         self.downsampling_box.setToolTip(
@@ -1839,12 +2238,15 @@ class SettingsDialog(_BaseDialog):
             "<li>peak:<br>"
             "Draws a saw wave from the minimum to the maximum from a "
             "collection of n samples.</li>"
+            "<li>m4:<br>"
+            "Keeps the first, minimum, maximum and last value "
+            "of n samples.</li>"
             "</ul>"
             "<i>(Those methods are adapted from "
             "pyqtgraph)</i><br>"
             'Default is "peak".'
         )
-        self.ds_method_cmbx.addItems(["subsample", "mean", "peak"])
+        self.ds_method_cmbx.addItems(["subsample", "mean", "peak", "m4"])
         self.ds_method_cmbx.setCurrentText(self.mne.ds_method)
         self.ds_method_cmbx.currentTextChanged.connect(
             _methpartial(self._value_changed, value_name="ds_method")
@@ -2031,6 +2433,9 @@ class SettingsDialog(_BaseDialog):
     def _toggle_antialiasing(self, _):
         self.weakmain()._toggle_antialiasing()
 
+    def _toggle_graphics_cache(self, _):
+        self.weakmain()._toggle_graphics_cache()
+
     def _update_monitor(self, *args, dim="height"):
         dpr = QApplication.primaryScreen().devicePixelRatio()
         px_height = QApplication.primaryScreen().size().height()
@@ -2245,21 +2650,27 @@ class HelpDialog(_BaseDialog):
         scroll_area.setSizePolicy(
             QSizePolicy.MinimumExpanding, QSizePolicy.MinimumExpanding
         )
-        scroll_widget = QWidget()
-        form_layout = QFormLayout()
-        for key in main.mne.keyboard_shortcuts:
-            key_dict = main.mne.keyboard_shortcuts[key]
-            if "description" in key_dict:
-                if "alias" in key_dict:
-                    key = key_dict["alias"]
-                for idx, key_des in enumerate(key_dict["description"]):
-                    key_name = key
-                    if "modifier" in key_dict:
-                        mod = key_dict["modifier"][idx]
-                        if mod is not None:
-                            key_name = mod + " + " + key_name
-                    form_layout.addRow(key_name, QLabel(key_des))
-        scroll_widget.setLayout(form_layout)
+        # The shortcut list is built once and taken back from the scroll area
+        # on close, so reopening the dialog does not recreate all labels
+        scroll_widget = self.mne.help_shortcuts_widget
+        if scroll_widget is None:
+            scroll_widget = QWidget()
+            form_layout = QFormLayout()
+            for key in self.mne.keyboard_shortcuts:
+                key_dict = self.mne.keyboard_shortcuts[key]
+                if "description" in key_dict:
+                    if "alias" in key_dict:
+                        key = key_dict["alias"]
+                    for idx, key_des in enumerate(key_dict["description"]):
+                        key_name = key
+                        if "modifier" in key_dict:
+                            mod = key_dict["modifier"][idx]
+                            if mod is not None:
+                                key_name = mod + " + " + key_name
+                        form_layout.addRow(key_name, QLabel(key_des))
+            scroll_widget.setLayout(form_layout)
+            self.mne.help_shortcuts_widget = scroll_widget
+        self.scroll_area = scroll_area
         scroll_area.setWidget(scroll_widget)
         layout.addWidget(scroll_area)
 
@@ -2309,6 +2720,11 @@ class HelpDialog(_BaseDialog):
         )
         self.update()
 
+    def closeEvent(self, event):  # noqa: D102
+        # Keep the shortcut list alive when the dialog gets deleted
+        self.scroll_area.takeWidget()
+        super().closeEvent(event)
+
 
 class ProjDialog(_BaseDialog):
     """A dialog to toggle projections."""
@@ -2372,33 +2788,54 @@ class _ChannelFig(FigureCanvasQTAgg):
         self.setFocusPolicy(Qt.FocusPolicy(Qt.StrongFocus | Qt.WheelFocus))
         self.setFocus()
         self._lasso_path = None
+        self._lasso_pen = self.mne.mkPen("red", width=2)
+        # Snapshot of the canvas while the lasso is drawn
+        self._lasso_bg = None
         # Only update when mouse is pressed
         self.setMouseTracking(False)
 
     def paintEvent(self, event):
-        super().paintEvent(event)
         # Lasso-Drawing doesn't seem to work with mpl, thus it is replicated
-        # in Qt.
+        # in Qt. While drawing, the canvas is blitted from a snapshot instead
+        # of being repainted by mpl for every mouse move.
+        if self._lasso_bg is None:
+            super().paintEvent(event)
         if self._lasso_path is not None:
             painter = QPainter(self)
-            painter.setPen(self.mne.mkPen("red", width=2))
+            if self._lasso_bg is not None:
+                painter.drawPixmap(0, 0, self._lasso_bg)
+            painter.setPen(self._lasso_pen)
             painter.drawPath(self._lasso_path)
             painter.end()
 
     def mouseMoveEvent(self, event):
         super().mouseMoveEvent(event)
 
+        pos = QPointF(event.pos())
         if self._lasso_path is None:
+            self._lasso_bg = self.grab()
             self._lasso_path = QPainterPath()
-            self._lasso_path.moveTo(event.pos())
+            self._lasso_path.moveTo(pos)
+            self.update()
         else:
-            self._lasso_path.lineTo(event.pos())
-
-        self.update()
+            last_pos = self._lasso_path.currentPosition()
+            # Slow drags would add many nearly collinear segments
+            if (pos - last_pos).manhattanLength() < 2:
+                return
+            # Only repaint around the new segment
+            self._lasso_path.lineTo(pos)
+            margin = self._lasso_pen.widthF() + 1
+            self.update(
+                QRectF(last_pos, pos)
+                .normalized()
+                .adjusted(-margin, -margin, margin, margin)
+                .toAlignedRect()
+            )
 
     def mouseReleaseEvent(self, event):
         super().mouseReleaseEvent(event)
         self._lasso_path = None
+        self._lasso_bg = None
         self.update()
 
     def keyPressEvent(self, event):
@@ -2416,21 +2853,16 @@ class SelectionDialog(_BaseDialog):  # noqa: D101
 
         layout = QVBoxLayout()
 
-        # Add channel plot
-        fig = _figure_agg(figsize=(6, 6), dpi=96)
-        ax = fig.add_axes([0, 0, 1, 1])
-        self.channel_fig = plot_sensors(
-            self.mne.info,
-            kind="select",
-            ch_type="all",
-            title="",
-            ch_groups=self.mne.group_by,
-            axes=ax,
-            show=False,
-        )[0]
-        self.channel_fig.lasso.callbacks.append(self._set_custom_selection)
-        self.channel_widget = _ChannelFig(self.channel_fig, self.mne)
-        layout.addWidget(self.channel_widget)
+        # The channel plot is built after the dialog is shown (or when it is
+        # accessed first), so the matplotlib figure doesn't delay opening
+        self._channel_fig = None
+        self._channel_widget = None
+        self._channel_placeholder = QLabel("Loading sensor plot...")
+        self._channel_placeholder.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self._channel_placeholder, stretch=1)
+        self._build_timer = QTimer(self)
+        self._build_timer.setSingleShot(True)
+        self._build_timer.timeout.connect(self._build_channel_fig)
 
         selections_dict = self.mne.ch_selections
         selections_dict.update(Custom=np.array([], dtype=int))  # for lasso
@@ -2445,8 +2877,6 @@ class SelectionDialog(_BaseDialog):  # noqa: D101
         self.mne.old_selection = list(selections_dict)[0]
         self.chkbxs[self.mne.old_selection].setChecked(True)
 
-        self._update_highlighted_sensors()
-
         # add instructions at bottom
         instructions = (
             "To use a custom selection, first click-drag on the sensor plot "
@@ -2461,6 +2891,41 @@ class SelectionDialog(_BaseDialog):  # noqa: D101
 
         self.setLayout(layout)
         self.show(center=False)
+        self._build_timer.start(0)
+
+    @property
+    def channel_fig(self):
+        """The matplotlib figure of the sensor plot."""
+        self._build_channel_fig()
+        return self._channel_fig
+
+    @property
+    def channel_widget(self):
+        """The canvas showing the sensor plot."""
+        self._build_channel_fig()
+        return self._channel_widget
+
+    def _build_channel_fig(self):
+        if self._channel_fig is not None:
+            return
+        from mne.viz import plot_sensors
+
+        fig = _figure_agg(figsize=(6, 6), dpi=96)
+        ax = fig.add_axes([0, 0, 1, 1])
+        self._channel_fig = plot_sensors(
+            self.mne.info,
+            kind="select",
+            ch_type="all",
+            title="",
+            ch_groups=self.mne.group_by,
+            axes=ax,
+            show=False,
+        )[0]
+        self._channel_fig.lasso.callbacks.append(self._set_custom_selection)
+        self._channel_widget = _ChannelFig(self._channel_fig, self.mne)
+        self.layout().replaceWidget(self._channel_placeholder, self._channel_widget)
+        self._channel_placeholder.deleteLater()
+        self._update_highlighted_sensors()
 
     def _chkbx_changed(self, checked=True, label=None):
         # _chkbx_changed is called either directly (with checked=None) or
@@ -2493,13 +2958,12 @@ class SelectionDialog(_BaseDialog):  # noqa: D101
         if label == "Custom":
             self.mne.ch_start = 0
         else:
-            all_values = list()
-            for key, chs in self.mne.ch_selections.items():
+            n_before = 0
+            for chs in self.mne.ch_selections.values():
                 if np.array_equal(chs, self.mne.picks):
-                    self.mne.ch_start = len(all_values)
+                    self.mne.ch_start = n_before
                     break
-                else:
-                    all_values = np.concatenate([all_values, chs])
+                n_before += len(chs)
 
         # Apply changes on view
         self.mne.plt.setYRange(
@@ -2514,24 +2978,31 @@ class SelectionDialog(_BaseDialog):  # noqa: D101
         # selections on different y-positions
         for trace in self.mne.traces:
             trace.update_ypos()
-            trace.update_data()
+            trace.update_data(data_changed=False)
 
     def _set_custom_selection(self):
         chs = self.channel_fig.lasso.selection
-        inds = np.isin(self.mne.ch_names, chs)
+        # Channel names are unique, which spares np.isin from sorting them out
+        inds = np.isin(self.mne.ch_names, chs, assume_unique=True)
         self.mne.ch_selections["Custom"] = inds.nonzero()[0]
-        if any(inds):
+        if inds.any():
             self._chkbx_changed(None, "Custom")
 
     def _update_highlighted_sensors(self):
+        # Applied when the channel plot gets built
+        if self._channel_fig is None:
+            return
         inds = np.isin(
-            self.mne.fig_selection.channel_fig.lasso.ch_names,
+            self.channel_fig.lasso.ch_names,
             self.mne.ch_names[self.mne.picks],
         ).nonzero()[0]
         self.channel_fig.lasso.select_many(inds)
         self.channel_widget.draw()
 
     def _update_bad_sensors(self, pick, mark_bad):
+        # The channel plot shows the bads from info when it gets built
+        if self._channel_fig is None:
+            return
         sensor_picks = list()
         ch_indices = channel_indices_by_type(self.mne.info)
         for this_type in _DATA_CH_TYPES_SPLIT:
@@ -2561,19 +3032,21 @@ class SelectionDialog(_BaseDialog):  # noqa: D101
         self._chkbx_changed(None, new_label)
 
     def _scroll_to_idx(self, idx):
-        all_values = list()
-        label = list(self.mne.ch_selections)[0]
-        for key, values in self.mne.ch_selections.items():
-            all_values = np.concatenate([all_values, values])
-            if idx < len(all_values):
-                label = key
-                break
+        labels = list(self.mne.ch_selections)
+        # Position after the last channel of each selection
+        ends = np.cumsum([len(chs) for chs in self.mne.ch_selections.values()])
+        label_idx = np.searchsorted(ends, idx, side="right")
+        label = labels[label_idx] if label_idx < len(labels) else labels[0]
         self._chkbx_changed(None, label)
 
     def closeEvent(self, event):  # noqa: D102
+        # Don't build the sensor plot anymore if it is still pending
+        self._build_timer.stop()
         super().closeEvent(event)
-        if hasattr(self.channel_fig.lasso, "callbacks"):
-            self.channel_fig.lasso.callbacks.clear()
+        if self._channel_fig is not None and hasattr(
+            self._channel_fig.lasso, "callbacks"
+        ):
+            self._channel_fig.lasso.callbacks.clear()
         for chkbx in self.chkbxs.values():
             _disconnect(chkbx.clicked, allow_error=True)
         main = self.weakmain()
@@ -2682,7 +3155,7 @@ class AnnotRegion(LinearRegionItem):
                 self._add_single_channel_annot(ch)
 
         self.mne.plt.addItem(self, ignoreBounds=True)
-        self.mne.plt.addItem(self.label_item, ignoreBounds=True)
+        self.mne.label_group.addItem(self.label_item)
 
     def _region_changed(self):
         # Check for overlapping regions
@@ -2724,8 +3197,10 @@ class AnnotRegion(LinearRegionItem):
 
         logger.debug(f"New {self.description} region: {onset:.2f} - {offset:.2f}")
         # remove overlapping regions
-        for region in overlapping_regions:
-            self.weakmain()._remove_region(region, from_annot=False)
+        main = self.weakmain()
+        with main._batch_annot_updates():
+            for region in overlapping_regions:
+                main._remove_region(region, from_annot=False)
         # re-set while blocking the signal to avoid re-running this function
         with QSignalBlocker(self):
             self.setRegion((onset, offset))
@@ -2773,26 +3248,51 @@ class AnnotRegion(LinearRegionItem):
             These annotations will be more transparent with a dashed outline.
         """
         color_string = self.mne.annotation_segment_colors[self.description]
-        self.base_color = _get_color(color_string, self.mne.dark)
-        self.hover_color = _get_color(color_string, self.mne.dark)
-        self.text_color = _get_color(color_string, self.mne.dark)
-        self.base_color.setAlpha(75 if all_channels else 15)
-        self.hover_color.setAlpha(150)
-        self.text_color.setAlpha(255)
-        kwargs = dict(color=self.hover_color, width=2)
-        if not all_channels:
-            color = _get_color(color_string, self.mne.dark)
-            color.setAlpha(75)
-            kwargs.update(
-                style=Qt.CustomDashLine,
-                cap=Qt.FlatCap,
-                dash=[8, 8],
-                color=color,
+        # Regions with the same color share their colors and pens, which are
+        # only read after this point
+        color_key = color_string
+        if isinstance(color_key, (list, np.ndarray)):
+            color_key = tuple(color_key)
+        key = (color_key, all_channels, self.mne.dark)
+        style_cache = vars(self.mne).setdefault("_annot_style_cache", dict())
+        if key not in style_cache:
+            base_color = _get_color(color_string, self.mne.dark)
+            hover_color = _get_color(color_string, self.mne.dark)
+            text_color = _get_color(color_string, self.mne.dark)
+            base_color.setAlpha(75 if all_channels else 15)
+            hover_color.setAlpha(150)
+            text_color.setAlpha(255)
+            kwargs = dict(color=hover_color, width=2)
+            if not all_channels:
+                color = _get_color(color_string, self.mne.dark)
+                color.setAlpha(75)
+                kwargs.update(
+                    style=Qt.CustomDashLine,
+                    cap=Qt.FlatCap,
+                    dash=[8, 8],
+                    color=color,
+                )
+            style_cache[key] = (
+                base_color,
+                hover_color,
+                text_color,
+                self.mne.mkPen(**kwargs),
+                self.mne.mkPen(color=text_color, width=2),
+                mkBrush(base_color),
+                mkBrush(hover_color),
             )
-        self.line_pen = self.mne.mkPen(**kwargs)
-        self.hover_pen = self.mne.mkPen(color=self.text_color, width=2)
-        self.setBrush(self.base_color)
-        self.setHoverBrush(self.hover_color)
+        (
+            self.base_color,
+            self.hover_color,
+            self.text_color,
+            self.line_pen,
+            self.hover_pen,
+            self.base_brush,
+            self.hover_brush,
+        ) = style_cache[key]
+        # Copies of a QBrush share their data
+        self.setBrush(self.base_brush)
+        self.setHoverBrush(self.hover_brush)
         self.label_item.setColor(self.text_color)
         for line in self.lines:
             line.setPen(self.line_pen)
@@ -2800,8 +3300,15 @@ class AnnotRegion(LinearRegionItem):
         self.update()
         self.sigUpdateColor.emit(color_string)
 
+    def lineMoved(self, i):
+        """Invalidate the onset-sorted region index when an edge moves."""
+        if hasattr(self, "mne"):
+            self.mne.region_index.clear()
+        super().lineMoved(i)
+
     def update_description(self, description):
         """Update description of annoation-region."""
+        self.mne.region_index.clear()
         self.description = description
         self.label_item.setText(description)
         self.label_item.update()
@@ -2816,16 +3323,19 @@ class AnnotRegion(LinearRegionItem):
         """Remove annotation-region."""
         self.removeSingleChannelAnnots.emit(self)
         self.removeRequested.emit(self)
-        vb = self.mne.viewbox
-        if vb and self.label_item in vb.addedItems:
-            vb.removeItem(self.label_item)
+        self._remove_label()
+
+    def _remove_label(self):
+        if self.label_item.parentItem() is self.mne.label_group:
+            self.label_item.setParentItem(None)
+            self.label_item.scene().removeItem(self.label_item)
 
     def select(self, selected):
         """Update select-state of annotation-region."""
         self.selected = selected
         if selected:
             self.label_item.setColor("w")
-            self.label_item.fill = mkBrush(self.hover_color)
+            self.label_item.fill = self.hover_brush
             self.gotSelected.emit(self)
         else:
             self.label_item.setColor(self.text_color)
@@ -2911,32 +3421,45 @@ class AnnotRegion(LinearRegionItem):
         else:
             self.sigRegionChanged.emit(self)
 
-    def update_label_pos(self):
-        """Update position of description-label from annotation-region."""
+    def paint(self, p, *args):  # noqa: D102
+        p.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        super().paint(p, *args)
+
+    def update_label_pos(self, *, ymax=None):
+        """Update position of description-label from annotation-region.
+
+        Parameters
+        ----------
+        ymax : float | None
+            The upper limit of the y-range of the view. If None, it is taken
+            from the viewbox.
+        """
         rgn = self.getRegion()
-        vb = self.mne.viewbox
-        if vb:
+        if ymax is None:
+            vb = self.mne.viewbox
+            if not vb:
+                return
             ymax = vb.viewRange()[1][1]
-            self.label_item.setPos(sum(rgn) / 2, ymax - 0.3)
+        self.label_item.setPos(sum(rgn) / 2, ymax - 0.3)
 
 
 class _AnnotEditDialog(_BaseDialog):
     def __init__(self, annot_dock):
         super().__init__(annot_dock.weakmain(), title="Edit Annotations")
+        # The dialog is kept by the annotation-dock and reused for every edit
+        self.setAttribute(Qt.WA_DeleteOnClose, False)
         self.ad = annot_dock
 
         self.current_mode = None
 
         layout = QVBoxLayout()
         self.descr_label = QLabel()
-        if self.mne.selected_region:
-            self.mode_cmbx = QComboBox()
-            self.mode_cmbx.addItems(["all", "selected"])
-            self.mode_cmbx.currentTextChanged.connect(self._mode_changed)
-            layout.addWidget(QLabel("Edit Scope:"))
-            layout.addWidget(self.mode_cmbx)
-        # Set group as default
-        self._mode_changed("all")
+        self.mode_label = QLabel("Edit Scope:")
+        layout.addWidget(self.mode_label)
+        self.mode_cmbx = QComboBox()
+        self.mode_cmbx.addItems(["all", "selected"])
+        self.mode_cmbx.currentTextChanged.connect(self._mode_changed)
+        layout.addWidget(self.mode_cmbx)
 
         layout.addWidget(self.descr_label)
         self.input_w = QLineEdit()
@@ -2950,6 +3473,21 @@ class _AnnotEditDialog(_BaseDialog):
         bt_layout.addWidget(cancel_bt)
         layout.addLayout(bt_layout)
         self.setLayout(layout)
+        self.open_edit()
+
+    def open_edit(self):
+        """Reset the dialog for the current selection and show it."""
+        # The edit scope can only be chosen with a selected region
+        has_selection = bool(self.mne.selected_region)
+        self.mode_label.setVisible(has_selection)
+        self.mode_cmbx.setVisible(has_selection)
+        with QSignalBlocker(self.mode_cmbx):
+            self.mode_cmbx.setCurrentIndex(0)
+        # Set group as default
+        self._mode_changed("all")
+        self.input_w.clear()
+        if self not in self.mne.child_figs:
+            self.mne.child_figs.append(self)
         self.show()
 
     def _mode_changed(self, mode):
@@ -2970,14 +3508,22 @@ class _AnnotEditDialog(_BaseDialog):
             self.close()
 
 
-def _select_all(chkbxs):
-    for chkbx in chkbxs:
-        chkbx.setChecked(True)
+def _rename_key(d, old, new):
+    d[new] = d[old]
+    del d[old]
+
+
+def _set_all_checked(model, state):
+    for row in range(model.rowCount()):
+        model.item(row).setCheckState(state)
+
+
+def _select_all(model):
+    _set_all_checked(model, Qt.CheckState.Checked)
 
 
-def _clear_all(chkbxs):
-    for chkbx in chkbxs:
-        chkbx.setChecked(False)
+def _clear_all(model):
+    _set_all_checked(model, Qt.CheckState.Unchecked)
 
 
 class AnnotationDock(QDockWidget):
@@ -2988,6 +3534,8 @@ class AnnotationDock(QDockWidget):
         self.weakmain = weakref.ref(main)
         self.mne = main.mne
         del main
+        self._icon_cache = dict()
+        self._annot_edit_dialog = None
         self._init_ui()
 
         self.setFeatures(
@@ -3036,7 +3584,14 @@ class AnnotationDock(QDockWidget):
         self.start_bx.setMinimum(0)
         self.start_bx.setMaximum(self.mne.xmax)
         self.start_bx.setSingleStep(0.05)
-        self.start_bx.valueChanged.connect(self._start_changed)
+        # Coalesce fast value changes (e.g. holding an arrow key) and apply
+        # them at once when editing is finished.
+        self._start_timer = QTimer(self)
+        self._start_timer.setSingleShot(True)
+        self._start_timer.setInterval(50)
+        self._start_timer.timeout.connect(self._start_changed)
+        self.start_bx.valueChanged.connect(self._schedule_start_changed)
+        self.start_bx.editingFinished.connect(self._flush_start_changed)
         layout.addWidget(self.start_bx)
 
         layout.addWidget(QLabel("Stop:"))
@@ -3045,7 +3600,12 @@ class AnnotationDock(QDockWidget):
         self.stop_bx.setMinimum(0)
         self.stop_bx.setMaximum(self.mne.xmax + 1 / self.mne.info["sfreq"])
         self.stop_bx.setSingleStep(0.05)
-        self.stop_bx.valueChanged.connect(self._stop_changed)
+        self._stop_timer = QTimer(self)
+        self._stop_timer.setSingleShot(True)
+        self._stop_timer.setInterval(50)
+        self._stop_timer.timeout.connect(self._stop_changed)
+        self.stop_bx.valueChanged.connect(self._schedule_stop_changed)
+        self.stop_bx.editingFinished.connect(self._flush_stop_changed)
         layout.addWidget(self.stop_bx)
 
         help_bt = QPushButton(QIcon.fromTheme("help"), "Help")
@@ -3056,17 +3616,21 @@ class AnnotationDock(QDockWidget):
         self.setWidget(widget)
 
     def _add_description_to_cmbx(self, description):
-        color_pixmap = QPixmap(25, 25)
         color = _get_color(
             self.mne.annotation_segment_colors[description], self.mne.dark
         )
         color.setAlpha(75)
-        color_pixmap.fill(color)
-        color_icon = QIcon(color_pixmap)
-        self.description_cmbx.addItem(color_icon, description)
+        # Descriptions with the same color share one icon
+        key = color.rgba()
+        if key not in self._icon_cache:
+            color_pixmap = QPixmap(25, 25)
+            color_pixmap.fill(color)
+            self._icon_cache[key] = QIcon(color_pixmap)
+        self.description_cmbx.addItem(self._icon_cache[key], description)
 
     def _add_description(self, new_description):
         self.mne.new_annotation_labels.append(new_description)
+        self.weakmain()._annotations_changed()
         self.mne.visible_annotations[new_description] = True
         self.weakmain()._setup_annotation_colors()
         self._add_description_to_cmbx(new_description)
@@ -3087,29 +3651,43 @@ class AnnotationDock(QDockWidget):
     def _edit_description_all(self, new_des):
         """Update descriptions of all annotations with the same description."""
         old_des = self.description_cmbx.currentText()
-        edit_regions = [r for r in self.mne.regions if r.description == old_des]
-        # Update regions & annotations
+        edit_regions = list(self.weakmain()._get_region_index(old_des)[2])
+        # Update regions & annotations (every annotation has a region)
+        descriptions = self.mne.inst.annotations.description
+        descriptions[descriptions == old_des] = new_des
         for ed_region in edit_regions:
-            idx = self.weakmain()._get_onset_idx(ed_region.getRegion()[0])
-            self.mne.inst.annotations.description[idx] = new_des
             ed_region.update_description(new_des)
         # Update containers with annotation-attributes
-        self.mne.new_annotation_labels.remove(old_des)
-        self.mne.new_annotation_labels = self.weakmain()._get_annotation_labels()
-        self.mne.visible_annotations[new_des] = self.mne.visible_annotations.pop(
-            old_des
-        )
-        self.mne.annotation_segment_colors[new_des] = (
-            self.mne.annotation_segment_colors.pop(old_des)
-        )
+        labels = self.mne.new_annotation_labels
+        if new_des in labels:
+            labels.remove(old_des)
+        else:
+            labels[labels.index(old_des)] = new_des
+        # Keep the sorted order of _get_annotation_labels
+        labels.sort()
+        self.weakmain()._annotations_changed()
+        _rename_key(self.mne.visible_annotations, old_des, new_des)
+        _rename_key(self.mne.annotation_segment_colors, old_des, new_des)
 
         # Update related widgets
-        self.weakmain()._setup_annotation_colors()
+        self._setup_description_color(new_des)
         self._update_regions_colors()
         self._update_description_cmbx()
         self.mne.current_description = new_des
         self.mne.overview_bar.update_annotations()
 
+    def _setup_description_color(self, description):
+        """Set up annotation colors if the edited description needs a color."""
+        # A pure rename carries over the color, which only has to be
+        # recomputed if the new description gets a fixed color.
+        user_colors = getattr(self.mne, "annotation_colors", None) or {}
+        if (
+            description not in self.mne.annotation_segment_colors
+            or description.lower().startswith(("bad", "edge"))
+            or description in user_colors
+        ):
+            self.weakmain()._setup_annotation_colors()
+
     def _edit_description_selected(self, new_des):
         """Update description only of selected region."""
         old_des = self.mne.selected_region.description
@@ -3126,19 +3704,21 @@ class AnnotationDock(QDockWidget):
         if old_des not in self.mne.inst.annotations.description:
             self.mne.new_annotation_labels.remove(old_des)
             self.mne.visible_annotations.pop(old_des)
-            self.mne.annotation_segment_colors[new_des] = (
-                self.mne.annotation_segment_colors.pop(old_des)
-            )
+            _rename_key(self.mne.annotation_segment_colors, old_des, new_des)
+        self.weakmain()._annotations_changed()
 
         # Update related widgets
-        self.weakmain()._setup_annotation_colors()
+        self._setup_description_color(new_des)
         self._update_regions_colors()
         self._update_description_cmbx()
         self.mne.overview_bar.update_annotations()
 
     def _edit_description_dlg(self):
         if len(self.mne.inst.annotations.description) > 0:
-            _AnnotEditDialog(self)
+            if self._annot_edit_dialog is None:
+                self._annot_edit_dialog = _AnnotEditDialog(self)
+            else:
+                self._annot_edit_dialog.open_edit()
         else:
             self.weakmain().message_box(
                 text="No Annotations!",
@@ -3148,14 +3728,20 @@ class AnnotationDock(QDockWidget):
 
     def _remove_description(self, rm_description):
         if rm_description != "":
-            # Remove regions
-            for rm_region in [
-                r for r in self.mne.regions if r.description == rm_description
-            ]:
-                rm_region.remove()
+            # Remove annotations at once and then their regions
+            annotations = self.mne.inst.annotations
+            annotations.delete(
+                np.flatnonzero(annotations.description == rm_description)
+            )
+            main = self.weakmain()
+            with main._batch_annot_updates():
+                for rm_region in list(main._get_region_index(rm_description)[2]):
+                    rm_region.removeSingleChannelAnnots.emit(rm_region)
+                    main._remove_region(rm_region, from_annot=False)
 
             # Remove from descriptions
             self.mne.new_annotation_labels.remove(rm_description)
+            main._annotations_changed()
             self._update_description_cmbx()
 
             # Remove from visible annotations
@@ -3172,8 +3758,8 @@ class AnnotationDock(QDockWidget):
 
     def _remove_description_dlg(self):
         rm_description = self.description_cmbx.currentText()
-        existing_annot = list(self.mne.inst.annotations.description).count(
-            rm_description
+        existing_annot = int(
+            np.sum(self.mne.inst.annotations.description == rm_description)
         )
         if existing_annot > 0:
             text = f"Remove annotations with {rm_description}?"
@@ -3196,42 +3782,42 @@ class AnnotationDock(QDockWidget):
         if ans == QMessageBox.Yes:
             self._remove_description(rm_description)
 
-    def _set_visible_region(self, state, *, description):
-        self.mne.visible_annotations[description] = bool(state)
+    def _set_visible_region(self, item):
+        checked = item.checkState() == Qt.CheckState.Checked
+        self.mne.visible_annotations[item.text()] = checked
 
     def _select_annotations(self):
         logger.debug("Annotation selected")
         select_dlg = QDialog(self)
-        chkbxs = list()
         layout = QVBoxLayout()
         layout.addWidget(QLabel("Select visible labels:"))
 
-        # Add descriptions to scroll-area to be scalable.
-        scroll_area = QScrollArea()
-        scroll_widget = QWidget()
-        scroll_layout = QVBoxLayout()
-
-        for des in self.mne.visible_annotations:
-            chkbx = QCheckBox(des)
-            chkbx.setChecked(self.mne.visible_annotations[des])
-            chkbx.stateChanged.connect(
-                _methpartial(self._set_visible_region, description=des)
+        # Use an item-model instead of one checkbox-widget per description
+        # to stay responsive with many descriptions.
+        model = QStandardItemModel(select_dlg)
+        for des, visible in self.mne.visible_annotations.items():
+            item = QStandardItem(des)
+            item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(
+                Qt.CheckState.Checked if visible else Qt.CheckState.Unchecked
             )
-            chkbxs.append(chkbx)
-            scroll_layout.addWidget(chkbx)
+            model.appendRow(item)
+        model.itemChanged.connect(self._set_visible_region)
 
-        scroll_widget.setLayout(scroll_layout)
-        scroll_area.setWidget(scroll_widget)
-        layout.addWidget(scroll_area)
+        list_view = QListView()
+        list_view.setUniformItemSizes(True)
+        list_view.setLayoutMode(QListView.LayoutMode.Batched)
+        list_view.setModel(model)
+        layout.addWidget(list_view)
 
         bt_layout = QGridLayout()
 
         all_bt = QPushButton("All")
-        all_bt.clicked.connect(partial(_select_all, chkbxs=chkbxs))
+        all_bt.clicked.connect(partial(_select_all, model=model))
         bt_layout.addWidget(all_bt, 0, 0)
 
         clear_bt = QPushButton("Clear")
-        clear_bt.clicked.connect(partial(_clear_all, chkbxs=chkbxs))
+        clear_bt.clicked.connect(partial(_clear_all, model=model))
         bt_layout.addWidget(clear_bt, 0, 1)
 
         ok_bt = QPushButton("Ok")
@@ -3244,6 +3830,7 @@ class AnnotationDock(QDockWidget):
         select_dlg.exec()
         all_bt.clicked.disconnect()
         clear_bt.clicked.disconnect()
+        model.itemChanged.disconnect()
 
         self.weakmain()._update_regions_visible()
 
@@ -3257,6 +3844,22 @@ class AnnotationDock(QDockWidget):
             else:
                 region.setZValue(1)
 
+    def _schedule_start_changed(self):
+        self._start_timer.start()
+
+    def _flush_start_changed(self):
+        if self._start_timer.isActive():
+            self._start_timer.stop()
+            self._start_changed()
+
+    def _schedule_stop_changed(self):
+        self._stop_timer.start()
+
+    def _flush_stop_changed(self):
+        if self._stop_timer.isActive():
+            self._stop_timer.stop()
+            self._stop_changed()
+
     def _start_changed(self):
         start = self.start_bx.value()
         sel_region = self.mne.selected_region
@@ -3273,7 +3876,8 @@ class AnnotationDock(QDockWidget):
                 icon=QMessageBox.Critical,
                 modal=False,
             )
-            self.start_bx.setValue(sel_region.getRegion()[0])
+            with QSignalBlocker(self.start_bx):
+                self.start_bx.setValue(sel_region.getRegion()[0])
 
     def _stop_changed(self):
         stop = self.stop_bx.value()
@@ -3287,7 +3891,8 @@ class AnnotationDock(QDockWidget):
                 info_text="Stop can't be smaller than Start!",
                 icon=QMessageBox.Critical,
             )
-            self.stop_bx.setValue(sel_region.getRegion()[1])
+            with QSignalBlocker(self.stop_bx):
+                self.stop_bx.setValue(sel_region.getRegion()[1])
 
     def _set_color(self):
         curr_descr = self.description_cmbx.currentText()
@@ -3310,6 +3915,9 @@ class AnnotationDock(QDockWidget):
     def update_values(self, region):
         """Update spinbox-values from region."""
         rgn = region.getRegion()
+        # Pending edits belong to the previously selected region
+        self._start_timer.stop()
+        self._stop_timer.stop()
         self.start_bx.setEnabled(True)
         self.stop_bx.setEnabled(True)
         with QSignalBlocker(self.start_bx):
@@ -3318,11 +3926,15 @@ class AnnotationDock(QDockWidget):
             self.stop_bx.setValue(rgn[1])
 
     def _update_description_cmbx(self):
-        self.description_cmbx.clear()
         descriptions = self.weakmain()._get_annotation_labels()
-        for description in descriptions:
-            self._add_description_to_cmbx(description)
-        self.description_cmbx.setCurrentText(self.mne.current_description)
+        # Handle the change of the current description once and not for
+        # clearing and adding every item
+        with QSignalBlocker(self.description_cmbx):
+            self.description_cmbx.clear()
+            for description in descriptions:
+                self._add_description_to_cmbx(description)
+            self.description_cmbx.setCurrentText(self.mne.current_description)
+        self._description_changed(self.description_cmbx.currentIndex())
 
     def _update_regions_colors(self):
         for region in self.mne.regions:
@@ -3333,6 +3945,8 @@ class AnnotationDock(QDockWidget):
         if self.description_cmbx.count() > 0:
             self.description_cmbx.setCurrentIndex(0)
             self.mne.current_description = self.description_cmbx.currentText()
+        self._start_timer.stop()
+        self._stop_timer.stop()
         with QSignalBlocker(self.start_bx):
             self.start_bx.setValue(0)
         with QSignalBlocker(self.stop_bx):
@@ -3408,6 +4022,21 @@ def _mouse_event_position(ev):
         return ev.pos()
 
 
+class _ParamsCopy:
+    """Run BrowserBase processing on a shallow copy of the browser parameters.
+
+    This lets the LoadThread process data with other settings than shown
+    without writing to the parameters the GUI thread reads.
+    """
+
+    _apply_filter = BrowserBase._apply_filter
+    _process_data = BrowserBase._process_data
+
+    def __init__(self, mne, **params):
+        self.mne = copy(mne)
+        vars(self.mne).update(params)
+
+
 class LoadThread(QThread):
     """A worker object for precomputing in a separate QThread."""
 
@@ -3430,14 +4059,17 @@ class LoadThread(QThread):
         # (at least for the sample dataset)
         # because of the frequent gui-update-calls.
         # Thus n_chunks = 10 should suffice.
+        # The chunks are copied into arrays allocated once the first chunk
+        # tells the number of channels and the dtypes
         data = None
         if self.mne.is_epochs:
-            times = (
-                np.arange(len(self.mne.inst) * len(self.mne.inst.times))
-                / self.mne.info["sfreq"]
-            )
+            n_times = len(self.mne.inst) * len(self.mne.inst.times)
+            times = np.arange(n_times) / self.mne.info["sfreq"]
         else:
+            n_times = len(self.mne.inst)
             times = None
+        pos = 0
+        last_emit = time.monotonic()
         n_chunks = min(10, len(self.mne.inst))
         chunk_size = len(self.mne.inst) // n_chunks
         browser = self.weakbrowser()
@@ -3462,30 +4094,35 @@ class LoadThread(QThread):
             else:
                 data_chunk, times_chunk = browser._load_data(start, stop)
                 if times is None:
-                    times = times_chunk
-                else:
-                    times = np.concatenate((times, times_chunk), axis=0)
+                    times = np.empty(n_times, times_chunk.dtype)
+                times[pos : pos + len(times_chunk)] = times_chunk
 
             if data is None:
-                data = data_chunk
-            else:
-                data = np.concatenate((data, data_chunk), axis=1)
+                data = np.empty((data_chunk.shape[0], n_times), data_chunk.dtype)
+            data[:, pos : pos + data_chunk.shape[1]] = data_chunk
+            pos += data_chunk.shape[1]
 
-            self.loadProgress.emit(n + 1)
+            # Limit progress updates to 20 per second for small chunks
+            now = time.monotonic()
+            if n == n_chunks - 1 or now - last_emit > 0.05:
+                self.loadProgress.emit(n + 1)
+                last_emit = now
 
         picks = self.mne.ch_order
         # Deactive remove dc because it will be removed for visible range
-        stashed_remove_dc = self.mne.remove_dc
-        self.mne.remove_dc = False
-        data = browser._process_data(data, 0, data.shape[-1], picks, self)
-        self.mne.remove_dc = stashed_remove_dc
+        data = browser._process_data(
+            data, 0, data.shape[-1], picks, self, remove_dc=False
+        )
+        # Single precision suffices for display and halves the memory read
+        # when slicing and downsampling the visible range. Scaling and the
+        # z-scores use the cast data, so the double precision data is freed
+        # right away.
+        data = data.astype(np.float32)
 
         ch_type_ordered = self.mne.ch_types[self.mne.ch_order]
-        for chii in range(data.shape[0]):
-            ch_type = ch_type_ordered[chii]
-            data[chii, :] *= self.mne.scalings[ch_type]
+        scalings = [self.mne.scalings[ch_type] for ch_type in ch_type_ordered]
+        data *= np.array(scalings)[:, np.newaxis]
 
-        self.mne.global_data = data
         self.mne.global_times = times
 
         # Calculate Z-Scores
@@ -3493,6 +4130,8 @@ class LoadThread(QThread):
         browser._get_zscore(data)
         del browser
 
+        self.mne.global_data = data
+
         self.loadingFinished.emit()
 
     def clean(self):  # noqa: D102
@@ -3532,6 +4171,8 @@ qsettings_params = {
     "downsampling": 1,
     # Downsampling-Method (set SettingsDialog for details)
     "ds_method": "peak",
+    # Cache the rendering of static overview items
+    "graphics_cache": True,
 }
 
 
@@ -3588,9 +4229,9 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
         BrowserBase.__init__(self, **kwargs)
         QMainWindow.__init__(self)
 
-        # Add to list to keep a reference and avoid premature
+        # Add to set to keep a reference and avoid premature
         # garbage-collection.
-        _browser_instances.append(self)
+        _browser_instances[self] = None
 
         # Set the browser style
         try:
@@ -3615,9 +4256,7 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
         self.mne.dark = _rgb_to_lab(bgcolor)[0] < 50
 
         # Prepend our icon search path and set fallback name
-        icons_path = f"{Path(__file__).parent}/icons"
-        QIcon.setThemeSearchPaths([icons_path] + QIcon.themeSearchPaths())
-        QIcon.setFallbackThemeName("light")
+        _init_icon_theme()
 
         # control raising with _qt_raise_window
         self.setAttribute(Qt.WA_ShowWithoutActivating, True)
@@ -3630,8 +4269,12 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
         # MessageBox modality needs to be adapted for tests
         # (otherwise test execution blocks)
         self.test_mode = False
+        # Exceptions from the Qt event loop only need capturing with pytest-qt
+        self._in_pytest_qt = "pytestqt" in sys.modules
         # A Settings-Dialog
         self.mne.fig_settings = None
+        # Keyboard-shortcut list of the Help-Dialog, kept for reopening it
+        self.mne.help_shortcuts_widget = None
         # Stores decimated data
         self.mne.decim_data = None
         # Stores ypos for selection-mode
@@ -3663,6 +4306,11 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
                 (self.mne.t_start, self.mne.t_start + self.mne.duration),
             )
             self.mne.epoch_idx = np.arange(epoch_idx[0], epoch_idx[1])
+            # use the length of one epoch as duration change
+            self.mne.min_duration = self.mne.epoch_dur
+        else:
+            # never show fewer than 3 samples
+            self.mne.min_duration = 3 / self.mne.info["sfreq"]
 
         # Load from QSettings if available
         for qparam in qsettings_params:
@@ -3680,16 +4328,16 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
             setattr(self.mne, qparam, qvalue)
 
         # Initialize channel-colors for faster indexing later
-        self.mne.ch_color_ref = dict()
-        for idx, ch_name in enumerate(self.mne.ch_names):
-            ch_type = self.mne.ch_types[idx]
-            self.mne.ch_color_ref[ch_name] = self.mne.ch_color_dict[ch_type]
+        ch_colors = [self.mne.ch_color_dict[ch_type] for ch_type in self.mne.ch_types]
+        self.mne.ch_color_ref = dict(zip(self.mne.ch_names, ch_colors))
+        # RGBA-array of the channel colors indexed by channel position
+        self.mne.ch_color_array = np.concatenate([to_rgba_array(c) for c in ch_colors])
 
         # Initialize epoch colors for faster indexing later
         if self.mne.is_epochs:
             if self.mne.epoch_colors is None:
                 self.mne.epoch_color_ref = np.repeat(
-                    [to_rgba_array(c) for c in self.mne.ch_color_ref.values()],
+                    self.mne.ch_color_array[:, np.newaxis],
                     len(self.mne.inst),
                     axis=1,
                 )
@@ -3806,6 +4454,15 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
                 label = self.mne.event_id_rev.get(ev_id, ev_id)
                 event_line = EventLine(self.mne, ev_time, label, color)
                 self.mne.event_lines.append(event_line)
+            # Only the event-lines inside the visible time range are added to
+            # the plot, sorted by time to find them with a binary search
+            order = np.argsort(self.mne.event_times, kind="stable")
+            self.mne.event_line_times = np.asarray(self.mne.event_times)[order]
+            self.mne.event_lines_sorted = [self.mne.event_lines[i] for i in order]
+            self.mne.event_lines_shown = (0, 0)
+            self._update_events_xrange(
+                (self.mne.t_start, self.mne.t_start + self.mne.duration)
+            )
         else:
             self.mne.events_visible = False
 
@@ -3877,12 +4534,20 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
         self.mne.crosshair_enabled = False
         self.mne.crosshair_h = None
         self.mne.crosshair = None
+        # Mouse moves are coalesced so the crosshair is updated only for the
+        # latest position once the pending events are processed
+        self._pending_mouse_pos = None
+        self._mouse_timer = QTimer(self)
+        self._mouse_timer.setSingleShot(True)
+        self._mouse_timer.setInterval(0)
+        self._mouse_timer.timeout.connect(self._apply_mouse_moved)
         self.mne.view.sigSceneMouseMoved.connect(self._mouse_moved)
 
         # Initialize Annotation-Widgets
         self.mne.annotation_mode = False
         if not self.mne.is_epochs:
             self._init_annot_mode()
+            self.mne.viewbox.sigYRangeChanged.connect(self._update_region_label_pos)
 
         # OverviewBar
         self.mne.overview_bar = OverviewBar(self)
@@ -4021,6 +4686,12 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
         ahelp.triggered.connect(self._toggle_help_fig)
         self.mne.toolbar.addAction(ahelp)
 
+        # Map toolbar actions by name (first one wins) for fast lookup
+        self.mne.toolbar_actions = dict()
+        for action in self.mne.toolbar.actions():
+            if not action.isSeparator():
+                self.mne.toolbar_actions.setdefault(action.iconText(), action)
+
         # Set Start-Range (after all necessary elements are initialized)
         self.mne.plt.setXRange(
             self.mne.t_start, self.mne.t_start + self.mne.duration, padding=0
@@ -4233,6 +4904,7 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
                 del self.mne.keyboard_shortcuts["t"]
             # disable histogram of epoch PTP amplitude
             del self.mne.keyboard_shortcuts["h"]
+        self.mne.key_dispatch = _make_key_dispatch(self.mne.keyboard_shortcuts)
 
     def _hidpi_mkPen(self, *args, **kwargs):
         kwargs["width"] = self._pixel_ratio * kwargs.get("width", 1.0)
@@ -4248,18 +4920,17 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
         range)
         """
         self.mne.scalebars.clear()
-        # To keep order (np.unique sorts)
+        # Channel types which can be scaled, in the order of the channels
+        # (np.unique would sort them)
+        valid_types = (
+            self.mne.scalings.keys()
+            & getattr(self.mne, "units", {}).keys()
+            & getattr(self.mne, "unit_scalings", {}).keys()
+        ) - {"stim"}
         ordered_types = self.mne.ch_types[self.mne.ch_order]
-        unique_type_idxs = np.unique(ordered_types, return_index=True)[1]
-        ch_types_ordered = [ordered_types[idx] for idx in sorted(unique_type_idxs)]
-        for ch_type in [
-            ct
-            for ct in ch_types_ordered
-            if ct != "stim"
-            and ct in self.mne.scalings
-            and ct in getattr(self.mne, "units", {})
-            and ct in getattr(self.mne, "unit_scalings", {})
-        ]:
+        for ch_type in dict.fromkeys(ordered_types.tolist()):
+            if ch_type not in valid_types:
+                continue
             scale_bar = ScaleBar(self.mne, ch_type)
             self.mne.scalebars[ch_type] = scale_bar
             self.mne.plt.addItem(scale_bar)
@@ -4319,16 +4990,19 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
 
     def scale_all(self, checked=False, *, step, update_spinboxes=True):
         """Scale all traces by multiplying with step."""
+        if step == 1:
+            return
         self.mne.scale_factor *= step
 
-        # Reapply clipping if necessary
-        if self.mne.clipping is not None:
-            self._update_data()
-
         # Scale Traces (by scaling the Item, not the data)
         for line in self.mne.traces:
             line.update_scale()
 
+        # Reapply clipping if necessary ("clamp" does not depend on the scale)
+        if self.mne.clipping is not None and self.mne.clipping != "clamp":
+            self._update_data()
+            self._draw_traces()
+
         # Update Scalebars
         self._update_scalebar_values()
 
@@ -4359,7 +5033,8 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
         del step
 
         # Get current range and add step to it
-        xmin, xmax = (i + rel_step for i in self.mne.viewbox.viewRange()[0])
+        xrange = self.mne.viewbox.viewRange()[0]
+        xmin, xmax = (i + rel_step for i in xrange)
 
         if xmin < 0:
             xmin = 0
@@ -4368,7 +5043,9 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
             xmax = self.mne.xmax
             xmin = xmax - self.mne.duration
 
-        self.mne.plt.setXRange(xmin, xmax, padding=0)
+        # e.g. when scrolling at the end of the data
+        if not _same_range(xrange, (xmin, xmax)):
+            self.mne.plt.setXRange(xmin, xmax, padding=0)
 
     def vscroll(self, step):
         """Scroll vertically by step."""
@@ -4388,7 +5065,8 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
                 step = self.mne.n_channels
             elif step == "-full":
                 step = -self.mne.n_channels
-            ymin, ymax = (i + step for i in self.mne.viewbox.viewRange()[1])
+            yrange = self.mne.viewbox.viewRange()[1]
+            ymin, ymax = (i + step for i in yrange)
 
             if ymin < 0:
                 ymin = 0
@@ -4397,23 +5075,23 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
                 ymax = self.mne.ymax
                 ymin = ymax - self.mne.n_channels - 1
 
-            self.mne.plt.setYRange(ymin, ymax, padding=0)
+            # e.g. when scrolling at the first or last channel
+            if not _same_range(yrange, (ymin, ymax)):
+                self.mne.plt.setYRange(ymin, ymax, padding=0)
 
     def change_duration(self, checked=False, *, step):
         """Change duration by step."""
-        xmin, xmax = self.mne.viewbox.viewRange()[0]
+        xrange = self.mne.viewbox.viewRange()[0]
+        xmin, xmax = xrange
 
+        min_dur = self.mne.min_duration
         if self.mne.is_epochs:
-            # use the length of one epoch as duration change
-            min_dur = len(self.mne.inst.times) / self.mne.info["sfreq"]
             step_dir = 1 if step > 0 else -1
             rel_step = min_dur * step_dir
             self.mne.n_epochs = np.clip(
                 self.mne.n_epochs + step_dir, 1, len(self.mne.inst)
             )
         else:
-            # never show fewer than 3 samples
-            min_dur = 3 * np.diff(self.mne.inst.times[:2])[0]
             rel_step = self.mne.duration * step
 
         xmax += rel_step
@@ -4430,7 +5108,8 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
             xmin = 0
 
         self.mne.ax_hscroll.update_duration()
-        self.mne.plt.setXRange(xmin, xmax, padding=0)
+        if not _same_range(xrange, (xmin, xmax)):
+            self.mne.plt.setXRange(xmin, xmax, padding=0)
 
     def change_nchan(self, checked=False, *, step):
         """Change number of channels by step."""
@@ -4439,7 +5118,8 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
                 step = self.mne.n_channels
             elif step == "-full":
                 step = -self.mne.n_channels
-            ymin, ymax = self.mne.viewbox.viewRange()[1]
+            yrange = self.mne.viewbox.viewRange()[1]
+            ymin, ymax = yrange
             ymax += step
             if ymax > self.mne.ymax:
                 ymax = self.mne.ymax
@@ -4452,7 +5132,8 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
                 ymax = ymin + 2
 
             self.mne.ax_vscroll.update_nchan()
-            self.mne.plt.setYRange(ymin, ymax, padding=0)
+            if not _same_range(yrange, (ymin, ymax)):
+                self.mne.plt.setYRange(ymin, ymax, padding=0)
 
         if self.mne.fig_settings is not None:
             self.mne.fig_settings._update_spinbox_values(ch_type="all", source="chans")
@@ -4520,8 +5201,16 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
         self.mne.overview_bar.update_vline()
 
     def _mouse_moved(self, pos):
-        """Show Crosshair if enabled at mouse move."""
+        """Schedule the crosshair update for the latest mouse position."""
         if self.mne.crosshair_enabled:
+            self._pending_mouse_pos = pos
+            if not self._mouse_timer.isActive():
+                self._mouse_timer.start()
+
+    def _apply_mouse_moved(self):
+        """Show Crosshair if enabled at the last mouse position."""
+        pos, self._pending_mouse_pos = self._pending_mouse_pos, None
+        if self.mne.crosshair_enabled and pos is not None:
             if self.mne.plt.sceneBoundingRect().contains(pos):
                 mousePoint = self.mne.viewbox.mapSceneToView(pos)
                 x, y = mousePoint.x(), mousePoint.y()
@@ -4531,13 +5220,8 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
                         self.mne.plt.addItem(self.mne.crosshair, ignoreBounds=True)
 
                     # Get ypos from trace
-                    trace = [
-                        tr
-                        for tr in self.mne.traces
-                        if tr.ypos - 0.5 < y < tr.ypos + 0.5
-                    ]
-                    if len(trace) == 1:
-                        trace = trace[0]
+                    trace = _get_trace_at(self.mne, y)
+                    if trace is not None:
                         idx = np.searchsorted(self.mne.times, x)
                         if self.mne.data_precomputed:
                             data = self.mne.data[trace.order_idx]
@@ -4598,13 +5282,14 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
         self.mne.t_start = xrange[0]
         self.mne.duration = xrange[1] - xrange[0]
 
+        self._update_events_xrange(xrange)
         self._redraw(update_data=True)
 
         # Update Time-Bar
         self.mne.ax_hscroll.update_value(xrange[0])
 
         # Update Overview-Bar
-        self.mne.overview_bar.update_viewrange()
+        self.mne.overview_bar.schedule_viewrange_update()
 
         # Update Scalebars
         self._update_scalebar_x_positions()
@@ -4615,10 +5300,10 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
     def _yrange_changed(self, _, yrange):
         if not self.mne.butterfly:
             if not self.mne.fig_selection:
-                # Update picks and data
-                self.mne.ch_start = np.clip(
-                    round(yrange[0]), 0, len(self.mne.ch_order) - self.mne.n_channels
-                )
+                # Update picks and data (min/max is much cheaper than np.clip on
+                # scalars, which matters while dragging)
+                max_start = len(self.mne.ch_order) - self.mne.n_channels
+                self.mne.ch_start = min(max(round(yrange[0]), 0), max_start)
                 self.mne.n_channels = round(yrange[1] - yrange[0] - 1)
                 self._update_picks()
                 # Update Channel-Bar
@@ -4626,19 +5311,21 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
             self._update_data()
 
         # Update Overview-Bar
-        self.mne.overview_bar.update_viewrange()
+        self.mne.overview_bar.schedule_viewrange_update()
 
         # Update Scalebars
         self._update_scalebar_y_positions()
 
-        off_traces = [tr for tr in self.mne.traces if tr.ch_idx not in self.mne.picks]
-        add_idxs = [
-            p for p in self.mne.picks if p not in [tr.ch_idx for tr in self.mne.traces]
-        ]
+        # Use sets for the membership tests between picks and traces
+        picks = set(self.mne.picks.tolist())
+        trace_idxs = {tr.ch_idx for tr in self.mne.traces}
+        off_traces = [tr for tr in self.mne.traces if tr.ch_idx not in picks]
+        add_idxs = [p for p in self.mne.picks if p not in trace_idxs]
 
         # Update range_idx for traces which just shifted in y-position
-        for trace in [tr for tr in self.mne.traces if tr not in off_traces]:
-            trace.update_range_idx()
+        for trace in self.mne.traces:
+            if trace.ch_idx in picks:
+                trace.update_range_idx()
 
         # Update number of traces.
         trace_diff = len(self.mne.picks) - len(self.mne.traces)
@@ -4653,11 +5340,9 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
 
         # Add new traces if necessary.
         if trace_diff > 0:
-            # Make copy to avoid skipping iteration.
-            idxs_copy = add_idxs.copy()
-            for aidx in idxs_copy[:trace_diff]:
+            for aidx in add_idxs[:trace_diff]:
                 DataTrace(self, aidx)
-                add_idxs.remove(aidx)
+            add_idxs = add_idxs[trace_diff:]
 
         # Update data of traces outside of yrange (reuse remaining trace-items)
         for trace, ch_idx in zip(off_traces, add_idxs):
@@ -4724,15 +5409,30 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
                 # try to select a somewhat centered point
                 stx = ds // 2
 
-                x1 = np.empty((n, 2))
-                x1[:] = times[stx : stx + n * ds : ds, np.newaxis]
-                times = x1.reshape(n * 2)
+                times = np.repeat(times[stx : stx + n * ds : ds], 2)
+                data = _peak_downsample(data, ds, n)
+
+            elif self.mne.ds_method == "m4":
+                # Keep first, minimum, maximum and last sample of each bin
+                # (M4 aggregation), with minimum and maximum in their order.
+                n = len(times) // ds
+                bin_times = times[: n * ds].reshape(n, ds)
+                x1 = np.empty((n, 4))
+                x1[:, 0] = bin_times[:, 0]
+                x1[:, 1] = x1[:, 2] = bin_times[:, ds // 2]
+                x1[:, 3] = bin_times[:, -1]
+                times = x1.reshape(n * 4)
 
-                y1 = np.empty((n_ch, n, 2))
                 y2 = data[:, : n * ds].reshape((n_ch, n, ds))
-                y1[:, :, 0] = y2.max(axis=2)
-                y1[:, :, 1] = y2.min(axis=2)
-                data = y1.reshape((n_ch, n * 2))
+                y_min = y2.min(axis=2)
+                y_max = y2.max(axis=2)
+                min_first = y2.argmin(axis=2) < y2.argmax(axis=2)
+                y1 = np.empty((n_ch, n, 4), data.dtype)
+                y1[:, :, 0] = y2[:, :, 0]
+                y1[:, :, 1] = np.where(min_first, y_min, y_max)
+                y1[:, :, 2] = np.where(min_first, y_max, y_min)
+                y1[:, :, 3] = y2[:, :, -1]
+                data = y1.reshape((n_ch, n * 4))
 
             self.mne.times, self.mne.data = times, data
 
@@ -4837,8 +5537,15 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
                 )
                 return False
 
-    def _process_data(self, data, start, stop, picks, signals=None):
-        data = super()._process_data(data, start, stop, picks, signals)
+    def _process_data(self, data, start, stop, picks, signals=None, *, remove_dc=None):
+        if remove_dc is None or remove_dc == self.mne.remove_dc:
+            data = super()._process_data(data, start, stop, picks, signals)
+        else:
+            # BrowserBase reads the setting from self.mne and writes the
+            # zero-line offset to it, so use a copy which may be changed
+            # (this is called from the LoadThread)
+            params = _ParamsCopy(self.mne, remove_dc=remove_dc)
+            data = params._process_data(data, start, stop, picks, signals)
 
         # Invert Data to be displayed from top on inverted Y-Axis
         data *= -1
@@ -4891,31 +5598,9 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
         if collapse_by > 0:
             data = data.reshape(data.shape[0], max_pixel_width, collapse_by)
             data = data.mean(axis=2)
-        z = zscore(data, axis=1)
+        z = _zscore(data)
         if z.size > 0:
-            zmin = np.min(z, axis=1)
-            zmax = np.max(z, axis=1)
-
-            # Convert into RGBA
-            zrgba = np.empty((*z.shape, 4))
-            for row_idx, row in enumerate(z):
-                for col_idx, value in enumerate(row):
-                    if math.isnan(value):
-                        value = 0
-                    if value == 0:
-                        rgba = [0, 0, 0, 0]
-                    elif value < 0:
-                        alpha = int(255 * value / abs(zmin[row_idx]))
-                        rgba = [0, 0, 255, alpha]
-                    else:
-                        alpha = int(255 * value / zmax[row_idx])
-                        rgba = [255, 0, 0, alpha]
-
-                    zrgba[row_idx, col_idx] = rgba
-
-            zrgba = np.require(zrgba, np.uint8, "C")
-
-            self.mne.zscore_rgba = zrgba
+            self.mne.zscore_rgba = _zscore_to_rgba(z)
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
     # ANNOTATIONS
@@ -4933,25 +5618,25 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
             )
         # Add region to list and plot
         self.mne.regions.append(region)
+        self.mne.region_index.clear()
 
         # Connect signals of region
         region.regionChangeFinished.connect(self._region_changed)
         region.gotSelected.connect(self._region_selected)
         region.removeRequested.connect(self._remove_region)
-        self.mne.viewbox.sigYRangeChanged.connect(region.update_label_pos)
         region.update_label_pos()
         return region
 
     def _remove_region(self, region, from_annot=True):
         # Remove from shown regions
-        if region.label_item in self.mne.plt.items:
-            self.mne.plt.removeItem(region.label_item)
-        if region in self.mne.plt.items:
-            self.mne.plt.removeItem(region)
+        region._remove_label()
+        # PlotItem.removeItem already skips items which it does not hold
+        self.mne.plt.removeItem(region)
 
         # Remove from all regions
         if region in self.mne.regions:
             self.mne.regions.remove(region)
+            self.mne.region_index.clear()
 
         # Reset selected region
         if region == self.mne.selected_region:
@@ -4968,9 +5653,28 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
         if from_annot:
             idx = self._get_onset_idx(region.getRegion()[0])
             self.mne.inst.annotations.delete(idx)
+            self._annotations_changed()
 
         # Update Overview-Bar
-        self.mne.overview_bar.update_annotations()
+        self._update_overview_annotations()
+
+    @contextmanager
+    def _batch_annot_updates(self):
+        """Update the overview bar only once for all region changes inside."""
+        self.mne.annot_batch_depth += 1
+        try:
+            yield
+        finally:
+            self.mne.annot_batch_depth -= 1
+            if self.mne.annot_batch_depth == 0 and self.mne.annot_batch_dirty:
+                self.mne.annot_batch_dirty = False
+                self.mne.overview_bar.update_annotations()
+
+    def _update_overview_annotations(self):
+        if self.mne.annot_batch_depth > 0:
+            self.mne.annot_batch_dirty = True
+        else:
+            self.mne.overview_bar.update_annotations()
 
     def _region_selected(self, region):
         old_region = self.mne.selected_region
@@ -4980,6 +5684,90 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
         self.mne.selected_region = region
         self.mne.fig_annotation.update_values(region)
 
+    def _get_region_bounds(self):
+        """Get all regions with their bounds and descriptions as arrays.
+
+        Returns the regions, their bounds, the unique descriptions and the
+        index into those for every region. This is kept in the region index
+        (under None), so it is rebuilt under the same conditions.
+        """
+        index = self.mne.region_index
+        if None not in index:
+            regions = list(self.mne.regions)
+            bounds = np.array([r.getRegion() for r in regions]).reshape(-1, 2)
+            descriptions, description_idx = np.unique(
+                np.array([r.description for r in regions], dtype=object),
+                return_inverse=True,
+            )
+            index[None] = (regions, bounds, descriptions, description_idx.ravel())
+        return index[None]
+
+    def _update_region_label_pos(self, _, yrange):
+        # One connection for all regions, which all use the same y-range
+        for region in self.mne.regions:
+            region.update_label_pos(ymax=yrange[1])
+
+    def _get_region_index(self, description):
+        """Get the regions of one description sorted by onset.
+
+        Returns the sorted onsets, the running maximum of the offsets and the
+        regions. The index is rebuilt after regions are added, removed, moved
+        or renamed.
+        """
+        index = self.mne.region_index
+        if description not in index:
+            regions = sorted(
+                (r for r in self.mne.regions if r.description == description),
+                key=lambda r: r.getRegion()[0],
+            )
+            bounds = np.array([r.getRegion() for r in regions]).reshape(-1, 2)
+            index[description] = (
+                bounds[:, 0].tolist(),
+                np.maximum.accumulate(bounds[:, 1]).tolist(),
+                regions,
+            )
+        return index[description]
+
+    def _get_regions_to_merge(self, description, onset, offset):
+        """Get the regions of a description with an endpoint in [onset, offset]."""
+        onsets, max_offsets, regions = self._get_region_index(description)
+        # Regions starting inside the range
+        start_idx = bisect_left(onsets, onset)
+        stop_idx = bisect_right(onsets, offset)
+        merge_regions = regions[start_idx:stop_idx]
+        # Regions starting before it can only overlap with their end
+        idx = start_idx - 1
+        while idx >= 0 and max_offsets[idx] >= onset:
+            if onset <= regions[idx].getRegion()[1] <= offset:
+                merge_regions.append(regions[idx])
+            idx -= 1
+        return merge_regions
+
+    def _annotations_changed(self):
+        """Invalidate the cached annotation labels."""
+        self.mne.annot_version += 1
+
+    def _get_annotation_labels(self):
+        """Get the unique labels in the raw object and added in the UI.
+
+        The labels are cached until the annotations or the added labels are
+        replaced or :meth:`_annotations_changed` is called.
+        """
+        annotations = self.mne.inst.annotations
+        labels = self.mne.new_annotation_labels
+        version = getattr(self.mne, "annot_version", 0)
+        cache = getattr(self.mne, "annotation_labels", None)
+        if (
+            cache is None
+            or cache[0] is not annotations
+            or cache[1] is not labels
+            or cache[2] != version
+        ):
+            cache = (annotations, labels, version, super()._get_annotation_labels())
+            self.mne.annotation_labels = cache
+        # Callers may modify the returned list
+        return list(cache[3])
+
     def _get_onset_idx(self, plot_onset):
         onset = _sync_onset(self.mne.inst, plot_onset, inverse=True)
         idx = np.where(self.mne.inst.annotations.onset == onset)[0][0]
@@ -5001,6 +5789,7 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
             region.description,
             self.mne.inst.annotations,
         )
+        self._annotations_changed()
         # update overview-bar
         self.mne.overview_bar.update_annotations()
 
@@ -5011,6 +5800,7 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
 
     def _init_annot_mode(self):
         self.mne.annotations_visible = True
+        self.mne.annot_version = 0
         self.mne.new_annotation_labels = self._get_annotation_labels()
         if len(self.mne.new_annotation_labels) > 0:
             self.mne.current_description = self.mne.new_annotation_labels[0]
@@ -5018,6 +5808,18 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
             self.mne.current_description = None
         self._setup_annotation_colors()
         self.mne.regions = list()
+        self.mne.region_index = dict()
+        self.mne.region_visible = (None, None)
+        self.mne.annot_batch_depth = 0
+        self.mne.annot_batch_dirty = False
+        # The labels of all regions share one parent item, drawn above the
+        # traces and all regions (the selected ones have z=2). An ItemGroup
+        # has no contents of its own, so its children keep their mouse events
+        # and bounds.
+        if getattr(self.mne, "label_group", None) is None:
+            self.mne.label_group = ItemGroup()
+            self.mne.label_group.setZValue(3)
+            self.mne.plt.addItem(self.mne.label_group, ignoreBounds=True)
         self.mne.selected_region = None
 
         # Initialize Annotation-Dock
@@ -5075,14 +5877,25 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
             return
         start = self.mne.t_start
         stop = start + self.mne.duration
-        for region in self.mne.regions:
-            if self.mne.visible_annotations[region.description]:
-                rgn = region.getRegion()
-                # Avoid NumPy bool here
-                visible = bool(rgn[0] <= stop and rgn[1] >= start)
-            else:
-                visible = False
-            region.update_visible(visible)
+        regions, bounds, descriptions, description_idx = self._get_region_bounds()
+        description_visible = np.array(
+            [self.mne.visible_annotations[descr] for descr in descriptions], bool
+        )
+        visible = (
+            description_visible[description_idx]
+            & (bounds[:, 0] <= stop)
+            & (bounds[:, 1] >= start)
+        )
+        # Only touch regions whose visibility changed since the last update
+        last_regions, last_visible = self.mne.region_visible
+        if last_regions is regions:
+            changed_idxs = np.flatnonzero(visible != last_visible)
+        else:
+            changed_idxs = range(len(regions))
+        for idx in changed_idxs:
+            # Avoid NumPy bool here
+            regions[idx].update_visible(bool(visible[idx]))
+        self.mne.region_visible = (regions, visible)
         self.mne.overview_bar.update_annotations()
 
     def _set_annotations_visible(self, visible):
@@ -5188,7 +6001,8 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
             trace.update_color()
             trace.update_ypos()
 
-        self._draw_traces()
+        # The traces only moved (_yrange_changed updated reassigned traces)
+        self._draw_traces(data_changed=False)
 
         self._update_ch_spinbox_values()
 
@@ -5200,6 +6014,22 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
         self.mne.remove_dc = not self.mne.remove_dc
         self._redraw()
 
+    def _update_events_xrange(self, xrange):
+        """Add event-lines entering and remove those leaving the time range."""
+        if not self.mne.event_lines:
+            return
+        start, stop = self.mne.event_lines_shown
+        new_start = np.searchsorted(self.mne.event_line_times, xrange[0], "left")
+        new_stop = np.searchsorted(self.mne.event_line_times, xrange[1], "right")
+        lines = self.mne.event_lines_sorted
+        for idx in range(start, stop):
+            if not new_start <= idx < new_stop:
+                self.mne.plt.removeItem(lines[idx])
+        for idx in range(new_start, new_stop):
+            if not start <= idx < stop:
+                self.mne.plt.addItem(lines[idx])
+        self.mne.event_lines_shown = (new_start, new_stop)
+
     def _set_events_visible(self, visible):
         for event_line in self.mne.event_lines:
             event_line.setVisible(visible)
@@ -5231,6 +6061,14 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
         self.mne.antialiasing = not self.mne.antialiasing
         self._redraw()
 
+    def _toggle_graphics_cache(self):
+        self.mne.graphics_cache = not self.mne.graphics_cache
+        cache_mode = _get_cache_mode(self.mne)
+        overview_bar = self.mne.overview_bar
+        for item in overview_bar.scene().items():
+            if item not in (overview_bar.v_line, overview_bar.viewrange_rect):
+                item.setCacheMode(cache_mode)
+
     def _toggle_overview_bar(self):
         visible = not self.mne.overview_bar.isVisible()
         for item in self.mne.overview_menu.actions():
@@ -5296,7 +6134,7 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
                 self._get_dlg_from_mpl(fig)
 
     def _create_selection_fig(self):
-        if not any([isinstance(fig, SelectionDialog) for fig in self.mne.child_figs]):
+        if not any(isinstance(fig, SelectionDialog) for fig in self.mne.child_figs):
             SelectionDialog(self)
 
     def message_box(
@@ -5335,43 +6173,23 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
             mods = int(mods)  # PyQt < 5.13
         except Exception:
             pass
-        modifiers = {
-            "Shift": bool(Qt.ShiftModifier & mods),
-            "Ctrl": bool(Qt.ControlModifier & mods),
-        }
-        for key_name in self.mne.keyboard_shortcuts:
-            key_dict = self.mne.keyboard_shortcuts[key_name]
-            if key_dict["qt_key"] == event.key() and "slot" in key_dict:
-                mod_idx = 0
-                # Get modifier
-                if "modifier" in key_dict:
-                    mods = [modifiers[mod] for mod in modifiers]
-                    if any(mods):
-                        # No multiple modifiers supported yet
-                        mod = [mod for mod in modifiers if modifiers[mod]][0]
-                        if mod in key_dict["modifier"]:
-                            mod_idx = key_dict["modifier"].index(mod)
-
-                slot_idx = mod_idx if mod_idx < len(key_dict["slot"]) else 0
-                slot = key_dict["slot"][slot_idx]
-
-                if "parameter" in key_dict:
-                    param_idx = mod_idx if mod_idx < len(key_dict["parameter"]) else 0
-                    val = key_dict["parameter"][param_idx]
-                    if "kw" in key_dict:
-                        slot(**{key_dict["kw"]: val})
-                    else:
-                        slot(val)
-                else:
-                    slot()
-
-                break
+        # No multiple modifiers supported yet
+        if Qt.ShiftModifier & mods:
+            mod = "Shift"
+        elif Qt.ControlModifier & mods:
+            mod = "Ctrl"
+        else:
+            mod = None
+        call = self.mne.key_dispatch.get((event.key(), mod))
+        if call is not None:
+            slot, args, kwargs = call
+            slot(*args, **kwargs)
 
-    def _draw_traces(self):
+    def _draw_traces(self, data_changed=True):
         # Update data in traces (=drawing traces)
         for trace in self.mne.traces:
             # Update data
-            trace.update_data()
+            trace.update_data(data_changed=data_changed)
 
     def _get_size(self):
         inch_width = self.width() / self.logicalDpiX()
@@ -5412,7 +6230,7 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
         kind="press",
         modifier=None,
     ):
-        add_points = add_points or list()
+        add_points = add_points or ()
         # Wait until Window is fully shown.
         QTest.qWaitForWindowExposed(self)
         # Scene-Dimensions still seem to change to final state when waiting
@@ -5439,10 +6257,10 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
             x = view_width * point[0]
             y = view_height * (1 - point[1])
             point = Point(x, y)
-            for idx, apoint in enumerate(add_points):
-                x2 = view_width * apoint[0]
-                y2 = view_height * (1 - apoint[1])
-                add_points[idx] = Point(x2, y2)
+            add_points = [
+                Point(view_width * apoint[0], view_height * (1 - apoint[1]))
+                for apoint in add_points
+            ]
 
         elif xform == "data":
             # For Qt, the equivalent of matplotlibs transData
@@ -5451,23 +6269,31 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
             # This only works on the View (self.mne.view)
             fig = self.mne.view
             point = self.mne.viewbox.mapViewToScene(Point(*point))
-            for idx, apoint in enumerate(add_points):
-                add_points[idx] = self.mne.viewbox.mapViewToScene(Point(*apoint))
+            add_points = [
+                self.mne.viewbox.mapViewToScene(Point(*apoint)) for apoint in add_points
+            ]
 
         elif xform == "none" or xform is None:
             if isinstance(point, tuple | list):
                 point = Point(*point)
             else:
                 point = Point(point)
-            for idx, apoint in enumerate(add_points):
-                if isinstance(apoint, tuple | list):
-                    add_points[idx] = Point(*apoint)
-                else:
-                    add_points[idx] = Point(apoint)
+            add_points = [
+                Point(*apoint) if isinstance(apoint, tuple | list) else Point(apoint)
+                for apoint in add_points
+            ]
 
-        # Use pytest-qt's exception-hook
-        with capture_exceptions() as exceptions:
-            widget = fig.viewport() if isinstance(fig, QGraphicsView) else fig
+        # Use pytest-qt's exception-hook (only needed when running under it)
+        if self._in_pytest_qt:
+            exc_context = capture_exceptions()
+        else:
+            exc_context = nullcontext([])
+        with exc_context as exceptions:
+            # Resolve the widget receiving the events once per figure
+            widget = getattr(fig, "_click_target", None)
+            if widget is None:
+                widget = fig.viewport() if isinstance(fig, QGraphicsView) else fig
+                fig._click_target = widget
             if kind == "press":
                 # always click because most interactivity comes form
                 # mouseClickEvent from pyqtgraph (just press doesn't suffice
@@ -5482,7 +6308,7 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
             elif kind == "drag":
                 _mouseDrag(
                     widget=widget,
-                    positions=[point] + add_points,
+                    positions=chain((point,), add_points),
                     button=button,
                     modifier=modifier,
                 )
@@ -5501,15 +6327,22 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
         self.vscroll(step)
 
     def _click_ch_name(self, ch_index, button):
-        self.mne.channel_axis.repaint()
-        # Wait because channel-axis may need time
-        # (came up with test_epochs::test_plot_epochs_clicks)
-        QTest.qWait(100)
+        ch_name = str(self.mne.ch_names[self.mne.picks[ch_index]])
+        # The picture is reset whenever the axis changes and ch_texts is
+        # refilled when it is drawn again, so only repaint if necessary.
+        if self.mne.channel_axis.picture is None or (
+            ch_name not in self.mne.channel_axis.ch_texts
+        ):
+            self.mne.channel_axis.repaint()
+            # Wait because channel-axis may need time
+            # (came up with test_epochs::test_plot_epochs_clicks)
+            QTest.qWait(100)
+        else:
+            QTest.qWait(10)
         if not self.mne.butterfly:
-            ch_name = str(self.mne.ch_names[self.mne.picks[ch_index]])
             xrange, yrange = self.mne.channel_axis.ch_texts[ch_name]
-            x = np.mean(xrange)
-            y = np.mean(yrange)
+            x = 0.5 * (xrange[0] + xrange[1])
+            y = 0.5 * (yrange[0] + yrange[1])
 
             self._fake_click((x, y), fig=self.mne.view, button=button, xform="none")
 
@@ -5525,7 +6358,7 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
         return list(ax.get_labels())
 
     def _get_scale_bar_texts(self):
-        return tuple(t.toPlainText() for t in self.mne.scalebar_texts.values())
+        return tuple(t.value_text for t in self.mne.scalebar_texts.values())
 
     def show(self):  # noqa: D102
         # Set raise_window like matplotlib if possible
@@ -5554,6 +6387,8 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
         """Customize close event."""
         event.accept()
         if hasattr(self, "mne"):
+            # Drop a crosshair update scheduled for the last mouse move
+            self._mouse_timer.stop()
             # Explicit disconnects to avoid reference cycles that gc can't
             # properly resolve ()
             if hasattr(self.mne, "plt"):
@@ -5564,14 +6399,16 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
                     allow_error = action.text() == ""
                     _disconnect(action.triggered, allow_error=allow_error)
             # Save settings going into QSettings.
+            qsettings = QSettings()
             for qsetting in qsettings_params:
-                value = getattr(self.mne, qsetting)
-                QSettings().setValue(qsetting, value)
+                qsettings.setValue(qsetting, getattr(self.mne, qsetting))
             for attr in (
                 "keyboard_shortcuts",
+                "key_dispatch",
                 "traces",
                 "plt",
                 "toolbar",
+                "toolbar_actions",
                 "fig_annotation",
             ):
                 if hasattr(self.mne, attr):
@@ -5580,7 +6417,7 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
                 for fig in self.mne.child_figs:
                     fig.close()
                 self.mne.child_figs.clear()
-            for attr in ("traces", "event_lines", "regions"):
+            for attr in ("traces", "event_lines", "event_lines_sorted", "regions"):
                 getattr(self.mne, attr, []).clear()
             if getattr(self.mne, "vline", None) is not None:
                 if self.mne.is_epochs:
@@ -5596,8 +6433,7 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
             self.load_thread = None
 
         # Remove self from browser_instances in globals
-        if self in _browser_instances:
-            _browser_instances.remove(self)
+        _browser_instances.pop(self, None)
         self._close(event)
         self.gotClosed.emit()
         # Make sure it gets deleted after it was closed.
@@ -5613,21 +6449,47 @@ class MNEQtBrowser(BrowserBase, QMainWindow, metaclass=_PGMetaClass):
 
     def _fake_click_on_toolbar_action(self, action_name, wait_after=500):
         """Trigger event associated with action 'action_name' in toolbar."""
-        for action in self.mne.toolbar.actions():
-            if not action.isSeparator():
-                if action.iconText() == action_name:
-                    action.trigger()
-                    break
-        else:
+        action = self.mne.toolbar_actions.get(action_name)
+        if action is None:
             raise ValueError(f"action_name={repr(action_name)} not found")
+        action.trigger()
         QTest.qWait(wait_after)
 
     def _qicon(self, name):
-        # Try to pull from the theme first but fall back to the local one
-        kind = "dark" if self.mne.dark else "light"
-        path = Path(__file__).parent / "icons" / kind / "actions" / f"{name}.svg"
-        path = path.resolve(strict=True)
-        return QIcon.fromTheme(name, QIcon(str(path)))
+        return _get_qicon(name=name, kind="dark" if self.mne.dark else "light")
+
+
+@functools.lru_cache(maxsize=100)
+def _get_qicon(*, name, kind):
+    # Try to pull from the theme first but fall back to the local one
+    path = Path(__file__).parent / "icons" / kind / "actions" / f"{name}.svg"
+    path = path.resolve(strict=True)
+    return QIcon.fromTheme(name, QIcon(str(path)))
+
+
+def _make_key_dispatch(keyboard_shortcuts):
+    """Map (Qt key, modifier) of the shortcuts to (slot, args, kwargs)."""
+    dispatch = dict()
+    for key_dict in keyboard_shortcuts.values():
+        qt_key = key_dict["qt_key"]
+        # The first shortcut with a slot handles the key
+        if "slot" not in key_dict or (qt_key, None) in dispatch:
+            continue
+        for mod in (None, "Shift", "Ctrl"):
+            mod_idx = 0
+            if mod in key_dict.get("modifier", ()):
+                mod_idx = key_dict["modifier"].index(mod)
+            slot_idx = mod_idx if mod_idx < len(key_dict["slot"]) else 0
+            args, kwargs = (), dict()
+            if "parameter" in key_dict:
+                param_idx = mod_idx if mod_idx < len(key_dict["parameter"]) else 0
+                val = key_dict["parameter"][param_idx]
+                if "kw" in key_dict:
+                    kwargs[key_dict["kw"]] = val
+                else:
+                    args = (val,)
+            dispatch[(qt_key, mod)] = (key_dict["slot"][slot_idx], args, kwargs)
+    return dispatch
 
 
 def _get_n_figs():
@@ -5639,38 +6501,45 @@ def _get_n_figs():
 
 
 def _close_all():
-    if len(QApplication.topLevelWindows()) > 0:
-        QApplication.closeAllWindows()
+    windows = [
+        window for window in QApplication.topLevelWindows() if window.isVisible()
+    ]
+    if len(windows) > 0:
+        # Post the close events and drain them once instead of dispatching
+        # every closeEvent synchronously.
+        for window in windows:
+            QCoreApplication.postEvent(window, QCloseEvent())
+        QCoreApplication.processEvents()
 
 
 # mouse testing functions adapted from pyqtgraph
 # (pyqtgraph.tests.ui_testing.py)
+_NO_BUTTON = Qt.MouseButton.NoButton
+_NO_MODIFIER = Qt.KeyboardModifier.NoModifier
+
+
 def _mousePress(widget, pos, button, modifier=None):
     if modifier is None:
-        modifier = Qt.KeyboardModifier.NoModifier
-    event = QMouseEvent(
-        QEvent.Type.MouseButtonPress, pos, button, Qt.MouseButton.NoButton, modifier
-    )
+        modifier = _NO_MODIFIER
+    event = QMouseEvent(QEvent.Type.MouseButtonPress, pos, button, _NO_BUTTON, modifier)
     QApplication.sendEvent(widget, event)
 
 
 def _mouseRelease(widget, pos, button, modifier=None):
     if modifier is None:
-        modifier = Qt.KeyboardModifier.NoModifier
+        modifier = _NO_MODIFIER
     event = QMouseEvent(
-        QEvent.Type.MouseButtonRelease, pos, button, Qt.MouseButton.NoButton, modifier
+        QEvent.Type.MouseButtonRelease, pos, button, _NO_BUTTON, modifier
     )
     QApplication.sendEvent(widget, event)
 
 
 def _mouseMove(widget, pos, buttons=None, modifier=None):
     if buttons is None:
-        buttons = Qt.MouseButton.NoButton
+        buttons = _NO_BUTTON
     if modifier is None:
-        modifier = Qt.KeyboardModifier.NoModifier
-    event = QMouseEvent(
-        QEvent.Type.MouseMove, pos, Qt.MouseButton.NoButton, buttons, modifier
-    )
+        modifier = _NO_MODIFIER
+    event = QMouseEvent(QEvent.Type.MouseMove, pos, _NO_BUTTON, buttons, modifier)
     QApplication.sendEvent(widget, event)
 
 
@@ -5681,12 +6550,21 @@ def _mouseClick(widget, pos, button, modifier=None):
 
 
 def _mouseDrag(widget, positions, button, modifier=None):
+    positions = tuple(positions)
+    if modifier is None:
+        modifier = _NO_MODIFIER
     _mouseMove(widget, positions[0])
     _mousePress(widget, positions[0], button, modifier)
-    # Delay for 10 ms for drag to be recognized.
-    QTest.qWait(10)
-    for pos in positions[1:]:
-        _mouseMove(widget, pos, button, modifier)
+    # pyqtgraph drops mouse moves which follow the previous one faster than its
+    # rate limit, so wait exactly that long for the drag to be recognized.
+    rate_limit = getConfigOption("mouseRateLimit")
+    QTest.qWait(int(np.ceil(1000 / rate_limit)) if rate_limit > 0 else 0)
+    # Skip consecutive duplicates, Qt would coalesce those moves anyway.
+    move_type = QEvent.Type.MouseMove
+    for prev, pos in zip(positions, positions[1:]):
+        if pos != prev:
+            event = QMouseEvent(move_type, pos, _NO_BUTTON, button, modifier)
+            QApplication.sendEvent(widget, event)
     _mouseRelease(widget, positions[-1], button, modifier)
 
 
@@ -5704,9 +6582,22 @@ def _setup_ipython(ipython=None):
     return ipython
 
 
-def _init_browser(**kwargs):
+@functools.lru_cache(maxsize=1)
+def _init_icon_theme():
+    icons_path = f"{Path(__file__).parent}/icons"
+    QIcon.setThemeSearchPaths([icons_path] + QIcon.themeSearchPaths())
+    QIcon.setFallbackThemeName("light")
+    return icons_path
+
+
+@functools.lru_cache(maxsize=1)
+def _init_pg_config():
     _setup_ipython()
     setConfigOption("enableExperimental", True)
+
+
+def _init_browser(**kwargs):
+    _init_pg_config()
     app_kwargs = dict()
     if kwargs.get("splash", False):
         app_kwargs["splash"] = "Initializing mne-qt-browser..."
@@ -161,6 +161,9 @@ def test_annotations_interactions(raw_orig, pg_backend):
     # Test editing descriptions (all)
     annot_dock._edit_description_all("D")
     assert len(np.where(raw_orig.annotations.description == "D")[0]) == 2
+    labels = fig.mne.new_annotation_labels
+    assert "A" not in labels
+    assert labels == sorted(labels)
 
     # Test editing descriptions (selected)
     # Select second region
@@ -213,6 +216,25 @@ def test_annotations_interactions(raw_orig, pg_backend):
     assert len(fig.mne.regions) == 1
 
 
+def test_annotations_merge_nested(raw_orig, pg_backend):
+    """Test that only regions with an endpoint in a new annotation are merged."""
+    raw_orig = raw_orig.copy().crop(tmax=20.0).resample(100)
+    first_time = raw_orig.first_time
+    # A long annotation with a short one nested at its start
+    raw_orig.annotations.append(np.array([0, 2]) + first_time, [10, 1], "A")
+    fig = raw_orig.plot(duration=raw_orig.duration)
+    long_region, short_region = sorted(
+        fig.mne.regions, key=lambda region: region.getRegion()[0]
+    )
+
+    # Inside the long one, after the short one
+    assert fig._get_regions_to_merge("A", 5, 9) == []
+    # Over the end of the long one
+    assert fig._get_regions_to_merge("A", 9, 12) == [long_region]
+    # Over the end of the short one
+    assert fig._get_regions_to_merge("A", 2.5, 4) == [short_region]
+
+
 def test_ch_specific_annot(raw_orig, pg_backend):
     """Test plotting channel specific annotations."""
     ch_names = ["MEG 0133", "MEG 0142", "MEG 0143", "MEG 0423"]
@@ -358,6 +380,11 @@ def test_pg_settings_dialog(raw_orig, pg_backend):
     assert downsampling_method_control.currentText() == "peak"
     assert fig.mne.ds_method == "peak"
 
+    downsampling_method_control.setCurrentText("m4")
+    QTest.qWait(100)
+    assert downsampling_method_control.currentText() == "m4"
+    assert fig.mne.ds_method == "m4"
+
     downsampling_method_control.setCurrentText("invalid_method_name")
     QTest.qWait(100)
     assert downsampling_method_control.currentText() != "invalid_method_name"
@@ -508,6 +535,18 @@ def test_pg_help_dialog(raw_orig, pg_backend):
     assert pg_backend._get_n_figs() == 1
 
 
+def test_pg_selection_dialog_close(raw_orig, pg_backend):
+    """Test closing the selection dialog before the sensor plot is built."""
+    fig = raw_orig.plot(group_by="selection")
+    fig.test_mode = True
+    dialog = fig.mne.fig_selection
+    assert dialog._build_timer.isActive()
+    dialog.close()
+    assert not dialog._build_timer.isActive()
+    QTest.qWait(50)
+    assert dialog._channel_fig is None
+
+
 def test_pg_toolbar_time_plus_minus(raw_orig, pg_backend):
     """Test time controls."""
     fig = raw_orig.plot()
@@ -716,3 +755,67 @@ def test_color_conversion(rgb, lab):
     assert_allclose(our_lab, lab, atol=2e-2)
     rgb_2 = _lab_to_rgb(lab)
     assert_allclose(rgb, rgb_2, atol=2e-2)
+
+
+def test_get_inverse_idx():
+    """Test the inverse index of channel orders with duplicated channels."""
+    from types import SimpleNamespace
+
+    from mne_qt_browser._pg_figure import _get_inverse_idx
+
+    mne = SimpleNamespace(ch_order=np.array([3, 0, 3, 1, 0]))
+    inverse_idx = _get_inverse_idx(mne, "ch_order")
+    # Like np.argwhere(ch_order == ch_idx)[0][0], the first position is used
+    for ch_idx in (0, 1, 3):
+        assert inverse_idx[ch_idx] == np.argwhere(mne.ch_order == ch_idx)[0][0]
+    assert _get_inverse_idx(mne, "ch_order") is inverse_idx
+    # A reassigned array is indexed again
+    mne.ch_order = np.array([1, 3, 0])
+    assert _get_inverse_idx(mne, "ch_order") == {1: 0, 3: 1, 0: 2}
+
+
+def test_zscore():
+    """Test the row-wise zscore against scipy."""
+    from scipy.stats import zscore
+
+    from mne_qt_browser._pg_figure import _zscore
+
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(5, 1000)) * 1e-6
+    assert_allclose(_zscore(data), zscore(data, axis=1), rtol=1e-5, atol=1e-5)
+
+
+def test_zscore_to_rgba():
+    """Test coloring of zscores for the overview."""
+    from mne_qt_browser._pg_figure import _zscore_to_rgba
+
+    z = np.array([[-2.0, -1.0, 0.0, np.nan, 1.0, 4.0]])
+    rgba = _zscore_to_rgba(z)
+    assert rgba.dtype == np.uint8
+    assert rgba.shape == (1, 6, 4)
+    assert_allclose(rgba[0, :, 0], [0, 0, 0, 0, 255, 255])
+    assert_allclose(rgba[0, :, 1], 0)
+    assert_allclose(rgba[0, :, 2], [255, 255, 0, 0, 0, 0])
+    assert_allclose(rgba[0, :, 3], [255, 127, 0, 0, 63, 255])
+
+
+@pytest.mark.parametrize("block_bytes", [None, 1])
+def test_peak_downsample(block_bytes, monkeypatch):
+    """Test peak downsampling against NumPy reductions."""
+    from mne_qt_browser import _pg_figure
+    from mne_qt_browser._pg_figure import _peak_downsample
+
+    if block_bytes is not None:
+        # Reduce one channel at a time in the NumPy fallback
+        monkeypatch.setattr(_pg_figure, "_PEAK_BLOCK_BYTES", block_bytes)
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(3, 1000))
+    data[1, 10] = np.nan
+    # Column-sliced views like the data of the visible range
+    data = data[:, 3:]
+    ds, n = 7, data.shape[1] // 7
+    out = _peak_downsample(data, ds, n)
+    bins = data[:, : n * ds].reshape(3, n, ds)
+    assert out.shape == (3, 2 * n)
+    assert_allclose(out[:, 0::2], bins.max(axis=2))
+    assert_allclose(out[:, 1::2], bins.min(axis=2))